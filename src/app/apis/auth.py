@@ -1,19 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException
+import hmac
+import os
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.schemas.auth import LoginRequest, RefreshRequest, TokenResponse
+from app.dependencies.rate_limit import login_rate_limit
+from app.schemas.auth import IntrospectRequest, IntrospectResponse, IntrospectResult, LoginRequest, RefreshRequest, TokenResponse
 from app.services.auth_service import AuthService, get_auth_service
-from app.services.token_service import TokenService
-from app.utils.auth import get_token_expiry, verify_token
+from app.services.token_service import AsyncTokenService
+from app.utils.auth import get_legacy_token_id, get_token_expiry, get_token_id, key_ring, token_cache, verify_token_cached
 
 
 router = APIRouter()
 bearer_scheme = HTTPBearer()
 
+# 게이트웨이의 JWKS 캐시 유지 시간
+JWKS_CACHE_MAX_AGE = 300
+# 설정 시 /introspect 호출에 X-Introspect-Key 헤더 필요
+INTROSPECT_API_KEY = os.getenv("INTROSPECT_API_KEY")
+
 @router.post("/login", 
             response_model=TokenResponse,
             summary="로그인", 
             description="사용자 로그인 후 JWT 토큰을 발급합니다.", 
+            dependencies=[Depends(login_rate_limit)],
             responses={
                  409: {
                      "description": "인증 실패", 
@@ -24,11 +34,31 @@ bearer_scheme = HTTPBearer()
                              }
                          }
                      }
+                 }, 
+                 429: {
+                     "description": "이메일 또는 IP별 로그인 시도 횟수 초과 (Retry-After 헤더 참고)", 
+                     "content": {
+                         "application/json": {
+                             "example": {
+                                 "detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
+                             }
+                         }
+                     }
+                 }, 
+                 503: {
+                     "description": "비밀번호 검증 작업 대기열 초과", 
+                     "content": {
+                         "application/json": {
+                             "example": {
+                                 "detail": "요청이 많아 잠시 후 다시 시도해주세요."
+                             }
+                         }
+                     }
                  }
              }
 )
-def login(login_data: LoginRequest, auth_service: AuthService = Depends(get_auth_service)):
-    user = auth_service.authenticate_user(login_data)
+async def login(login_data: LoginRequest, auth_service: AuthService = Depends(get_auth_service)):
+    user = await auth_service.authenticate_user(login_data)
 
     if not user:
         raise HTTPException(
@@ -37,25 +67,27 @@ def login(login_data: LoginRequest, auth_service: AuthService = Depends(get_auth
             headers={"WWW-Authenticate": "Bearer"}
         )
     
-    token_data = auth_service.create_user_token(user)
+    token_data = await auth_service.create_user_token(user)
     return token_data
 
 @router.post("/logout")
-def logout(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
+async def logout(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
     token = credentials.credentials
     token_expiry = get_token_expiry(token)
     #print(token_expiry)
     #print("------------")
-    TokenService.blacklist_token(token, token_expiry)
+    await AsyncTokenService.blacklist_token(get_token_id(token, verify_token_cached(token)), token_expiry)
+    token_cache.invalidate(token)
 
     return {"message": "로그아웃"}
 
+# 사용한 refresh token은 폐기되고 새 refresh token이 함께 발급됨
 @router.post(
     "/refresh",
     response_model=TokenResponse
 )
-def refresh_token(refresh_token: RefreshRequest, auth_service: AuthService = Depends(get_auth_service)):
-    token = auth_service.refresh_access_token(refresh_token.refresh_token)
+async def refresh_token(refresh_token: RefreshRequest, auth_service: AuthService = Depends(get_auth_service)):
+    token = await auth_service.refresh_access_token(refresh_token.refresh_token)
 
     if not token:
         raise HTTPException(
@@ -63,22 +95,73 @@ def refresh_token(refresh_token: RefreshRequest, auth_service: AuthService = Dep
             detail="사용자 접근이 유효하지 않습니다.",
             headers={"WWW-Authenticate": "Bearer"}
         )
-    
-    token["refresh_token"] = refresh_token.refresh_token
+
     return token
 
-# TODO: 전체 로그아웃 시험 필요함
+# 전체 로그아웃
+# 사용자 epoch 갱신으로 다른 기기의 access token도 함께 무효화
 @router.post(
     "/logout-all",
 )
-def logout_all_sessions(
+async def logout_all_sessions(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
 ):
     token = credentials.credentials
     token_expiry = get_token_expiry(token)
-    TokenService.blacklist_token(token, token_expiry)
+    payload = verify_token_cached(token)
+    if payload is None:
+        raise HTTPException(
+            status_code=401,
+            detail="사용자 접근이 유효하지 않습니다.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    await AsyncTokenService.blacklist_token(get_token_id(token, payload), token_expiry)
+    token_cache.invalidate(token)
+
+    user_id = payload.get("user_id")
+    await AsyncTokenService.revoke_user_tokens(user_id)
+    await AsyncTokenService.remove_refresh_token(user_id)
+
+    return {"message": "모든 기기로부터 로그아웃되었습니다."}
+
+# 공개 키 목록 (JWKS)
+# 다른 서비스가 인증 서버 호출 없이 토큰을 직접 검증할 수 있도록 비대칭 키의 공개 키만 노출
+@router.get(
+    "/.well-known/jwks.json",
+    summary="JWKS",
+    description="토큰 검증용 공개 키 목록을 반환합니다.",
+)
+async def jwks(response: Response):
+    response.headers["Cache-Control"] = f"public, max-age={JWKS_CACHE_MAX_AGE}"
+    return key_ring.jwks()
+
+# 토큰 일괄 검증 (게이트웨이용)
+# 서명/만료 검증 후 폐기 여부를 한 번의 Redis 조회로 확인, 결과는 요청 순서와 같음
+# access token만 활성으로 판단하며 refresh token은 비활성으로 반환
+@router.post(
+    "/introspect",
+    response_model=IntrospectResponse,
+    summary="토큰 일괄 검증",
+    description="최대 100개의 access token에 대해 활성 여부와 claims를 반환합니다.",
+)
+async def introspect_tokens(
+    introspect_request: IntrospectRequest,
+    x_introspect_key: str | None = Header(default=None),
+):
+    if INTROSPECT_API_KEY and not hmac.compare_digest(x_introspect_key or "", INTROSPECT_API_KEY):
+        raise HTTPException(status_code=401, detail="사용자 접근이 유효하지 않습니다.")
+
+    candidates = []
+    for index, token in enumerate(introspect_request.tokens):
+        payload = verify_token_cached(token)
+        if payload is not None and payload.get("user_id") is not None and payload.get("type") != "refresh":
+            candidates.append((index, (get_token_id(token, payload), payload, get_legacy_token_id(token, payload))))
 
-    user_id = verify_token(token).get("user_id")
-    TokenService.remove_refresh_token(user_id)
+    revoked = await AsyncTokenService.are_tokens_revoked([token for _, token in candidates])
 
-    return {"message": "모든 기기로부터 로그아웃되었습니다."}
\ No newline at end of file
+    results = [IntrospectResult(active=False) for _ in introspect_request.tokens]
+    for (index, (_, payload, _)), is_revoked in zip(candidates, revoked):
+        if not is_revoked:
+            results[index] = IntrospectResult(active=True, claims=payload, exp=payload.get("exp"))
+    return IntrospectResponse(results=results)
\ No newline at end of file
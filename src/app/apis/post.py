@@ -1,10 +1,26 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Literal
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
+from app.database import open_read_db
 from app.dependencies.auth import get_current_user
-from app.models.user import User
-from app.schemas.post import PostCreate, PostResponse, PostUpdate
+from app.schemas.post import (
+    PostBulkCreateRequest,
+    PostBulkDeleteRequest,
+    PostBulkResponse,
+    PostBulkUpdateRequest,
+    PostCreate,
+    PostPage,
+    PostResponse,
+    PostUpdate,
+)
+from app.schemas.user import UserPrincipal
 from app.services.post_service import PostService, get_post_service
+from app.utils.etag import etag_matches
+from app.utils.fast_json import FastJSONResponse
+from app.utils.export import EXPORT_ENCODERS, POST_EXPORT_MEDIA_TYPES
+from app.utils.pagination import POSTS_PAGE_DEFAULT_LIMIT, POSTS_PAGE_MAX_LIMIT, InvalidCursorError
 
 
 router = APIRouter()
@@ -16,20 +32,31 @@ router = APIRouter()
         summary="새 게시글 생성", 
         description="새로운 게시글을 생성합니다."
         )
-def create_post(
+async def create_post(
     post: PostCreate, 
     post_service: PostService = Depends(get_post_service),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
     ):
-    create_post = post_service.create_post(post, current_user)
+    create_post = await post_service.create_post(post, current_user)
     return create_post
 
 @router.get(
         "/posts/", 
-        response_model=List[PostResponse],
+        response_model=PostPage,
+        response_class=FastJSONResponse,
         summary="게시글 리스트 조회", 
-        description="게시글 리스트를 조회합니다.", 
+        description="게시글 리스트를 최신순으로 조회합니다. 다음 페이지는 응답의 next_cursor를 cursor로 전달해 조회합니다.", 
         responses={
+            400: {
+                "description": "잘못된 커서", 
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "잘못된 커서입니다."
+                        }
+                    }
+                }
+            },
             404: {
                 "description": "게시글 조회 실패", 
                 "content": {
@@ -42,13 +69,151 @@ def create_post(
             }
         }
 )
-def get_posts(post_service: PostService = Depends(get_post_service)):
-    posts = post_service.get_posts()
+async def get_posts(
+    limit: int = Query(POSTS_PAGE_DEFAULT_LIMIT, ge=1, le=POSTS_PAGE_MAX_LIMIT), 
+    cursor: str | None = None, 
+    author_id: int | None = None, 
+    if_none_match: str | None = Header(None), 
+    post_service: PostService = Depends(get_post_service)
+    ):
+    # 캐시된 JSON을 검증/재직렬화 없이 그대로 반환 (response_model은 문서화 용도)
+    try:
+        posts = await post_service.get_posts_json(limit, cursor, author_id, if_none_match)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
 
     if posts is None:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
     
-    return posts
+    etag, body = posts
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return FastJSONResponse(content=body, headers={"ETag": etag})
+
+
+# 게시글 일괄 처리
+# 요청 전체를 하나의 트랜잭션으로 처리하고 항목별 결과를 반환
+# /posts/{post_id}보다 먼저 등록되어야 함
+@router.post(
+        "/posts/bulk", 
+        response_model=PostBulkResponse, 
+        summary="게시글 일괄 생성", 
+        description="여러 게시글을 한 번에 생성합니다."
+        )
+async def create_posts(
+    request: PostBulkCreateRequest, 
+    post_service: PostService = Depends(get_post_service),
+    current_user: UserPrincipal = Depends(get_current_user)
+    ):
+    results = await post_service.create_posts(request.items, current_user)
+    return {"results": results}
+
+@router.put(
+        "/posts/bulk", 
+        response_model=PostBulkResponse, 
+        summary="게시글 일괄 수정", 
+        description="여러 게시글을 한 번에 수정합니다. 항목별 status는 403(권한 없음), 404(게시글 없음)일 수 있습니다."
+        )
+async def update_posts(
+    request: PostBulkUpdateRequest, 
+    post_service: PostService = Depends(get_post_service),
+    current_user: UserPrincipal = Depends(get_current_user)
+    ):
+    results = await post_service.update_posts(request.items, current_user)
+    return {"results": results}
+
+@router.delete(
+        "/posts/bulk", 
+        response_model=PostBulkResponse, 
+        summary="게시글 일괄 삭제", 
+        description="여러 게시글을 한 번에 삭제합니다. 항목별 status는 403(권한 없음), 404(게시글 없음)일 수 있습니다."
+        )
+async def delete_posts(
+    request: PostBulkDeleteRequest, 
+    post_service: PostService = Depends(get_post_service),
+    current_user: UserPrincipal = Depends(get_current_user)
+    ):
+    results = await post_service.delete_posts(request.ids, current_user)
+    return {"results": results}
+
+
+# 게시글 검색
+# /posts/{post_id}보다 먼저 등록되어야 함
+@router.get(
+        "/posts/search", 
+        response_model=PostPage,
+        summary="게시글 검색", 
+        description="제목과 본문에서 모든 검색어를 포함하는 게시글을 관련도순으로 조회합니다. 다음 페이지는 응답의 next_cursor를 cursor로 전달해 조회합니다.", 
+        responses={
+            400: {
+                "description": "잘못된 커서", 
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "잘못된 커서입니다."
+                        }
+                    }
+                }
+            },
+            501: {
+                "description": "검색 미지원", 
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "검색을 지원하지 않는 데이터베이스입니다."
+                        }
+                    }
+                }
+            }
+        }
+)
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=200), 
+    limit: int = Query(POSTS_PAGE_DEFAULT_LIMIT, ge=1, le=POSTS_PAGE_MAX_LIMIT), 
+    cursor: str | None = None, 
+    author_id: int | None = None, 
+    post_service: PostService = Depends(get_post_service)
+    ):
+    try:
+        posts, next_cursor = await post_service.search_posts(q, limit, cursor, author_id)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    return {"items": posts, "next_cursor": next_cursor}
+
+
+# 게시글 내보내기
+# /posts/{post_id}보다 먼저 등록되어야 함
+@router.get(
+        "/posts/export", 
+        response_class=StreamingResponse,
+        summary="게시글 내보내기", 
+        description="게시글 전체를 NDJSON 또는 CSV로 스트리밍합니다. 작성자와 작성 시각 범위로 필터링할 수 있습니다.", 
+        responses={
+            200: {
+                "content": {
+                    "application/x-ndjson": {},
+                    "text/csv": {}
+                }
+            }
+        }
+)
+async def export_posts(
+    format: Literal["ndjson", "csv"] = "ndjson", 
+    author_id: int | None = None, 
+    created_from: datetime | None = None, 
+    created_to: datetime | None = None
+    ):
+    # 응답을 모두 보낼 때까지 세션이 유지되어야 하므로 의존성 대신 스트림 안에서 세션을 엶
+    async def partitions():
+        async with open_read_db() as db:
+            async for rows in PostService(db).stream_posts(author_id, created_from, created_to):
+                yield rows
+
+    return StreamingResponse(
+        EXPORT_ENCODERS[format](partitions()), 
+        media_type=POST_EXPORT_MEDIA_TYPES[format], 
+        headers={"Content-Disposition": f'attachment; filename="posts.{format}"'}
+    )
 
 
 # 게시글 상세 조회
@@ -58,13 +223,20 @@ def get_posts(post_service: PostService = Depends(get_post_service)):
         summary="게시글 상세 조회", 
         description="게시글 상세 정보를 조회합니다."
         )
-def get_post(post_id: int, post_service: PostService = Depends(get_post_service)):
-    post = post_service.get_post(post_id)
+async def get_post(
+    post_id: int, 
+    if_none_match: str | None = Header(None), 
+    post_service: PostService = Depends(get_post_service)
+    ):
+    post = await post_service.get_post_json(post_id, if_none_match)
 
     if post is None:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
     
-    return post
+    etag, body = post
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 # 게시글 수정
@@ -74,13 +246,13 @@ def get_post(post_id: int, post_service: PostService = Depends(get_post_service)
         summary="게시글 수정", 
         description="게시글 정보를 수정합니다."
         )
-def update_post(
+async def update_post(
     post_id: int, 
     post_update: PostUpdate, 
     post_service: PostService = Depends(get_post_service),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
     ):
-    post = post_service.update_post(post_id, post_update, current_user)
+    post = await post_service.update_post(post_id, post_update, current_user)
 
     if post is None:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
@@ -94,12 +266,12 @@ def update_post(
         summary="게시글 삭제", 
         description="게시글을 삭제합니다."
         )
-def delete_post(
+async def delete_post(
     post_id:int, 
     post_service: PostService = Depends(get_post_service), 
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
     ): 
-    post = post_service.delete_post(post_id, current_user)
+    post = await post_service.delete_post(post_id, current_user)
     if post is False:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.") 
     return {"message": "게시글이 성공적으로 삭제되었습니다."}
\ No newline at end of file
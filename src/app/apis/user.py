@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 
+from app.dependencies.rate_limit import register_rate_limit
 from app.schemas.user import UserCreate, UserResponse
 from app.services.user_service import UserService, get_user_service
 
@@ -9,6 +10,7 @@ router = APIRouter()
              response_model=UserResponse, 
              summary="회원가입", 
              description="새로운 사용자를 등록합니다.", 
+             dependencies=[Depends(register_rate_limit)],
              responses={
                  409: {
                      "description": "중복된 이메일(또는 사용자 이름)로 회원가입 시도", 
@@ -19,24 +21,44 @@ router = APIRouter()
                              }
                          }
                      }
+                 }, 
+                 429: {
+                     "description": "IP별 회원가입 요청 횟수 초과 (Retry-After 헤더 참고)", 
+                     "content": {
+                         "application/json": {
+                             "example": {
+                                 "detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
+                             }
+                         }
+                     }
+                 }, 
+                 503: {
+                     "description": "비밀번호 해시 작업 대기열 초과", 
+                     "content": {
+                         "application/json": {
+                             "example": {
+                                 "detail": "요청이 많아 잠시 후 다시 시도해주세요."
+                             }
+                         }
+                     }
                  }
              }
 )
-def register_user(user: UserCreate, user_service: UserService=Depends(get_user_service)):
-    existed_user_email = user_service.get_user_by_email(user.email)
+async def register_user(user: UserCreate, user_service: UserService=Depends(get_user_service)):
+    existed_user_email = await user_service.get_user_by_email(user.email)
     if existed_user_email:
         raise HTTPException(
             status_code=409,
             detail="이미 존재하는 이메일입니다."
         )
     
-    existed_user_name = user_service.get_user_by_username(user.username)
+    existed_user_name = await user_service.get_user_by_username(user.username)
     if existed_user_name:
         raise HTTPException(
             status_code=409,
             detail="이미 존재하는 사용자 이름입니다."
         )
     
-    create_user = user_service.create_user(user)
+    create_user = await user_service.create_user(user)
 
     return create_user
\ No newline at end of file
@@ -0,0 +1,281 @@
+import bisect
+import contextvars
+import functools
+import inspect
+import threading
+import time
+
+import redis
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event
+
+from app.core import redis_config
+from app.database import async_engine, async_read_engine, engine, read_engine
+
+# 지연시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청별 구성요소(redis/db/jwt/password) 누적 시간
+# 미들웨어가 요청마다 새 dict를 설정하고, 계측 지점에서 같은 dict에 더함
+_request_components: contextvars.ContextVar[dict | None] = contextvars.ContextVar("request_components", default=None)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    labels = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        labels.append(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+class Counter:
+    def __init__(self, name: str, description: str, labels: tuple = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in self._values.items():
+                lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, description: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = buckets
+        # label 값 -> [버킷별 개수..., 합계, 전체 개수]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(label_values)
+            if series is None:
+                series = self._values[label_values] = [0] * len(self.buckets) + [0.0, 0]
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {label_values: list(series) for label_values, series in self._values.items()}
+
+        for label_values, series in snapshot.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                bucket_label = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, label_values, bucket_label)} {cumulative}")
+            inf_label = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, label_values, inf_label)} {series[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, label_values)} {series[-2]}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, label_values)} {series[-1]}")
+        return lines
+
+
+class Gauge:
+    """
+    scrape 시점에 callback으로 값을 읽는 게이지
+    callback은 {label 값 tuple: 값} 을 반환
+    """
+    def __init__(self, name: str, description: str, labels: tuple, callback):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.callback = callback
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} gauge"]
+        for label_values, value in self.callback().items():
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {value}")
+        return lines
+
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route", "status")
+)
+http_request_component_duration = Histogram(
+    "http_request_component_seconds", "Time spent per component within a request", ("method", "route", "component")
+)
+component_calls = Counter(
+    "app_component_calls_total", "Instrumented calls (Redis operations, DB queries, JWT, password hashing)", ("component", "operation")
+)
+component_duration = Counter(
+    "app_component_seconds_total", "Total time spent in instrumented calls", ("component", "operation")
+)
+
+_metrics: list = [http_request_duration, http_request_component_duration, component_calls, component_duration]
+
+
+def record_component(component: str, operation: str, elapsed: float):
+    component_calls.inc(component, operation)
+    component_duration.inc(component, operation, amount=elapsed)
+
+    components = _request_components.get()
+    if components is not None:
+        components[component] = components.get(component, 0.0) + elapsed
+
+
+# 함수(동기/비동기) 실행 시간을 component로 기록하는 데코레이터
+def instrumented(component: str, operation: str | None = None):
+    def decorator(func):
+        name = operation or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record_component(component, name, time.perf_counter() - start)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_component(component, name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+# 클래스의 모든 public classmethod에 instrumented 적용
+# 다른 계측 메서드를 호출하기만 하는 메서드는 시간이 중복 집계되지 않도록 exclude로 제외
+# 실제 호출을 담당하는 private 메서드는 include로 추가
+def instrument_methods(cls, component: str, exclude: tuple = (), include: tuple = ()):
+    for name, attr in list(vars(cls).items()):
+        if name in exclude or not isinstance(attr, classmethod):
+            continue
+        if name.startswith("_") and name not in include:
+            continue
+        setattr(cls, name, classmethod(instrumented(component, f"{cls.__name__}.{name}")(attr.__func__)))
+    return cls
+
+
+def instrument_engine(engine, operation: str):
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record_component("db", operation, time.perf_counter() - conn.info["query_start"].pop())
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+class MetricsMiddleware:
+    """
+    요청 전체 시간과 구성요소별 시간을 route 템플릿 단위로 기록하는 ASGI 미들웨어
+    매칭되지 않은 경로는 label 폭증을 막기 위해 하나로 묶음
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        components = {}
+        token = _request_components.set(components)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_components.reset(token)
+
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            http_request_duration.observe(elapsed, method, path, status)
+            for component, component_elapsed in components.items():
+                http_request_component_duration.observe(component_elapsed, method, path, component)
+
+
+# 조회 전용 engine이 쓰기 engine과 같으면 한 번만 집계
+def _db_engines():
+    engines = [("sync", engine), ("async", async_engine.sync_engine)]
+    if read_engine is not engine:
+        engines.append(("sync_read", read_engine))
+    if async_read_engine is not async_engine:
+        engines.append(("async_read", async_read_engine.sync_engine))
+    return engines
+
+def _db_pool_stats() -> dict:
+    stats = {}
+    for name, pool in ((name, db_engine.pool) for name, db_engine in _db_engines()):
+        if hasattr(pool, "checkedout"):
+            stats[(name, "checked_out")] = pool.checkedout()
+            stats[(name, "size")] = pool.size()
+            stats[(name, "overflow")] = pool.overflow()
+    return stats
+
+# (사용 중, 유휴) 연결 수
+# 동기 BlockingConnectionPool은 생성된 연결 목록과 유휴 연결 큐(None은 아직 만들지 않은 자리)로 관리함
+def _redis_connection_counts(pool) -> tuple[int, int]:
+    if isinstance(pool, redis.BlockingConnectionPool):
+        idle = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+        return len(pool._connections) - idle, idle
+    return len(getattr(pool, "_in_use_connections", ())), len(getattr(pool, "_available_connections", ()))
+
+def _redis_pool_stats() -> dict:
+    stats = {}
+    pools = (("sync", redis_config.redis_client.connection_pool), ("async", redis_config.async_redis_pool))
+    for name, pool in pools:
+        if pool is None:
+            continue
+        stats[(name, "in_use")], stats[(name, "available")] = _redis_connection_counts(pool)
+    return stats
+
+_metrics.append(Gauge("db_pool_connections", "SQLAlchemy connection pool state", ("engine", "state"), _db_pool_stats))
+_metrics.append(Gauge("redis_pool_connections", "Redis connection pool state", ("client", "state"), _redis_pool_stats))
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def init_metrics(app: FastAPI):
+    for name, db_engine in _db_engines():
+        instrument_engine(db_engine, name)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
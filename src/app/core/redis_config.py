@@ -1,31 +1,114 @@
+import os
+
 from fastapi import FastAPI
 import redis
+import redis.asyncio
+import redis.asyncio.retry
 import redis.exceptions
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+
+from app.utils.circuit_breaker import CircuitBreaker
+
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+REDIS_DB = int(os.getenv("REDIS_DB", 0))
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+# 클라이언트별(동기/비동기) 커넥션 풀 크기
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 100))
+# 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 1.0))
+# 명령별 응답/연결 타임아웃 (Redis 정지 시 TCP 타임아웃까지 대기하지 않도록)
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", 0.5))
+# 연결/타임아웃 오류 시 재시도 횟수 (지수 백오프)
+REDIS_RETRY_ATTEMPTS = int(os.getenv("REDIS_RETRY_ATTEMPTS", 1))
+REDIS_HEALTH_CHECK_INTERVAL = 30
+
+# circuit breaker 설정
+REDIS_BREAKER_FAILURE_THRESHOLD = int(os.getenv("REDIS_BREAKER_FAILURE_THRESHOLD", 5))
+REDIS_BREAKER_RESET_SECONDS = float(os.getenv("REDIS_BREAKER_RESET_SECONDS", 5))
+# breaker가 열렸을 때 동작
+# "fail-closed": 503 반환
+# "fail-open": 최근 동기화된 로컬 폐기 스냅샷(revocation filter, epoch 캐시)으로 인증 계속
+REDIS_DEGRADED_MODE = os.getenv("REDIS_DEGRADED_MODE", "fail-closed")
+# fail-open에서 허용하는 로컬 스냅샷의 최대 경과 시간 (초과 시 fail-closed)
+REDIS_DEGRADED_SNAPSHOT_MAX_AGE = float(os.getenv("REDIS_DEGRADED_SNAPSHOT_MAX_AGE", 30))
+
+# 비동기 커넥션 풀에 추가로 전달할 옵션 (벤치마크에서 connection_class를 fakeredis로 교체할 때 사용)
+REDIS_POOL_OPTIONS: dict = {}
+
+
+def _pool_options() -> dict:
+    return {
+        "host": REDIS_HOST,
+        "port": REDIS_PORT,
+        "db": REDIS_DB,
+        "password": REDIS_PASSWORD,
+        "max_connections": REDIS_MAX_CONNECTIONS,
+        "timeout": REDIS_POOL_TIMEOUT,
+        "socket_timeout": REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": REDIS_CONNECT_TIMEOUT,
+        "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+        "decode_responses": True,
+    }
+
+def _backoff() -> ExponentialBackoff:
+    return ExponentialBackoff(cap=0.1, base=0.01)
 
-# 환경변수 처리 안함
-REDIS_HOST = "localhost"
-REDIS_PORT = 6379
-REDIS_DB = 0
-REDIS_PASSWORD = None
 
 redis_client = redis.Redis(
-    host = REDIS_HOST, 
-    port=REDIS_PORT, 
-    db=REDIS_DB,
-    password=REDIS_PASSWORD,
-    decode_responses=True
+    connection_pool=redis.BlockingConnectionPool(
+        retry=Retry(_backoff(), REDIS_RETRY_ATTEMPTS),
+        **_pool_options()
+    )
 )
 
+redis_breaker = CircuitBreaker("redis", REDIS_BREAKER_FAILURE_THRESHOLD, REDIS_BREAKER_RESET_SECONDS)
+
+# 비동기 클라이언트는 init_redis의 startup/shutdown 이벤트에서 열고 닫음
+async_redis_pool: redis.asyncio.BlockingConnectionPool | None = None
+async_redis_client: redis.asyncio.Redis | None = None
+
+
+def get_async_redis() -> redis.asyncio.Redis:
+    if async_redis_client is None:
+        raise RuntimeError("Redis async client is not initialized")
+    return async_redis_client
+
+
+def redis_health() -> dict:
+    return {**redis_breaker.stats(), "degraded_mode": REDIS_DEGRADED_MODE}
+
+
 def init_redis(app: FastAPI):
     @app.on_event("startup")
     async def startup_redis_client():
+        global async_redis_pool, async_redis_client
+
+        async_redis_pool = redis.asyncio.BlockingConnectionPool(
+            retry=redis.asyncio.retry.Retry(_backoff(), REDIS_RETRY_ATTEMPTS),
+            **{**_pool_options(), **REDIS_POOL_OPTIONS}
+        )
+        async_redis_client = redis.asyncio.Redis(connection_pool=async_redis_pool)
+
         try:
             redis_client.ping()
+            await async_redis_client.ping()
             print("Redis connection completed")
-        except redis.exceptions.ConnectionError:
-            print("Failed to connect to Redis")
+        except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as e:
+            # 시작 시점부터 장애면 첫 요청들이 타임아웃을 기다리지 않도록 breaker에 반영
+            redis_breaker.record_failure()
+            print(f"Failed to connect to Redis: {e}")
 
     @app.on_event("shutdown")
     async def shutdown_redis_client():
+        global async_redis_pool, async_redis_client
+
         redis_client.close()
-        print("Redis connection closed")
\ No newline at end of file
+        if async_redis_client is not None:
+            await async_redis_client.aclose()
+            await async_redis_pool.disconnect()
+            async_redis_client = None
+            async_redis_pool = None
+        print("Redis connection closed")
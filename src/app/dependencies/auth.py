@@ -1,52 +1,79 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_sync_db
 from app.models.user import User
-from app.services.token_service import TokenService
-from app.utils.auth import verify_token
+from app.schemas.user import UserPrincipal
+from app.services.principal_cache import principal_cache
+from app.services.token_service import AsyncTokenService, TokenService
+from app.utils.auth import get_legacy_token_id, get_token_id, verify_token_cached
 
 bearer_schema = HTTPBearer()
 
-def get_current_user(credential: HTTPAuthorizationCredentials = Depends(bearer_schema), db: Session = Depends(get_db)):
-    token = credential.credentials
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=401,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+# refresh token도 user_id를 가지므로 type으로 구분해 access token만 허용
+def _verify_payload(token: str) -> dict:
+    payload = verify_token_cached(token)
+
+    if payload is None or payload.get("user_id") is None or payload.get("type") == "refresh":
+        raise _unauthorized("인증되지 않은 사용자입니다.")
 
-    if TokenService.is_token_blacklisted(token):
-        raise HTTPException(
-            status_code=401, 
-            detail="만료된 토큰입니다.", 
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-
-    payload = verify_token(token)
-
-    if payload is None:
-        raise HTTPException(
-            status_code=401,
-            detail="인증되지 않은 사용자입니다.", 
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    username = payload.get("username")
-    if username is None:
-        raise HTTPException(
-            status_code=401,
-            detail="인증되지 않은 사용자입니다.", 
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    query = (
-        select(User)
-        .where(User.username == username)
+    return payload
+
+# 캐시 미스일 때만 호출되며 인증에 필요한 컬럼만 조회
+def _principal_query(user_id: int):
+    return (
+        select(User.id, User.email, User.username)
+        .where(User.id == user_id)
     )
-    user = db.execute(query).scalar_one_or_none()
-
-    if user is None:
-        raise HTTPException(
-            status_code=401,
-            detail="사용자를 찾을 수 없습니다.", 
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    return user
\ No newline at end of file
+
+def _to_principal(row) -> UserPrincipal:
+    if row is None:
+        raise _unauthorized("사용자를 찾을 수 없습니다.")
+    return UserPrincipal.model_validate(row)
+
+# 비동기 인증 의존성
+# 사용자 정보는 principal 캐시에서 가져오며 미스일 때만 DB를 조회
+# Redis와 DB 조회 모두 이벤트 루프에서 처리하므로 스레드풀을 점유하지 않음
+# 캐시된 payload도 블랙리스트 확인을 거친 뒤에만 사용됨
+async def get_current_user(credential: HTTPAuthorizationCredentials = Depends(bearer_schema), db: AsyncSession = Depends(get_db)):
+    token = credential.credentials
+    payload = _verify_payload(token)
+
+    if await AsyncTokenService.is_token_blacklisted(get_token_id(token, payload), get_legacy_token_id(token, payload)):
+        raise _unauthorized("만료된 토큰입니다.")
+
+    if await AsyncTokenService.is_token_revoked_for_user(payload):
+        raise _unauthorized("만료된 토큰입니다.")
+
+    principal = await principal_cache.get_async(payload["user_id"])
+    if principal is None:
+        principal = _to_principal((await db.execute(_principal_query(payload["user_id"]))).one_or_none())
+        await principal_cache.set_async(principal)
+    return principal
+
+# 동기 인증 의존성 (비교/벤치마크용)
+def get_current_user_sync(credential: HTTPAuthorizationCredentials = Depends(bearer_schema), db: Session = Depends(get_sync_db)):
+    token = credential.credentials
+    payload = _verify_payload(token)
+
+    if TokenService.is_token_blacklisted(get_token_id(token, payload), get_legacy_token_id(token, payload)):
+        raise _unauthorized("만료된 토큰입니다.")
+
+    if TokenService.is_token_revoked_for_user(payload):
+        raise _unauthorized("만료된 토큰입니다.")
+
+    principal = principal_cache.get(payload["user_id"])
+    if principal is None:
+        principal = _to_principal(db.execute(_principal_query(payload["user_id"])).one_or_none())
+        principal_cache.set(principal)
+    return principal
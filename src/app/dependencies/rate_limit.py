@@ -0,0 +1,69 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+
+from fastapi import HTTPException, Request
+
+from app.services.rate_limiter import RateLimitRule, rate_limiter
+
+# 로그인 제한 (창 크기 내 허용 횟수)
+LOGIN_RATE_LIMIT_WINDOW = 60
+LOGIN_RATE_LIMIT_PER_EMAIL = 10
+# 같은 NAT 뒤의 여러 사용자를 고려해 IP 한도는 넉넉하게
+LOGIN_RATE_LIMIT_PER_IP = 60
+# 회원가입도 bcrypt 해시를 수행하므로 IP 기준으로 제한
+REGISTER_RATE_LIMIT_WINDOW = 60 * 10
+REGISTER_RATE_LIMIT_PER_IP = 20
+
+KeyFunc = Callable[[Request], Awaitable[Optional[str]]]
+
+
+# 프록시 뒤에서는 uvicorn --proxy-headers로 실제 클라이언트 IP가 채워져야 함
+async def client_ip(request: Request) -> Optional[str]:
+    return request.client.host if request.client else None
+
+# JSON 본문의 필드 값 (키에 원문이 남지 않도록 digest 사용)
+def body_field(field: str) -> KeyFunc:
+    async def key(request: Request) -> Optional[str]:
+        try:
+            value = (await request.json()).get(field)
+        except (ValueError, AttributeError):
+            return None
+        if not isinstance(value, str) or not value:
+            return None
+        return hashlib.sha256(value.strip().lower().encode()).hexdigest()[:32]
+    return key
+
+
+class RateLimit:
+    """
+    요청 제한 dependency
+    라우트의 dependencies에 추가하면 DB 조회와 bcrypt 작업 전에 실행됨
+        @router.post("/login", dependencies=[Depends(login_rate_limit)])
+    """
+    def __init__(self, *rules: tuple[RateLimitRule, KeyFunc]):
+        self.rules = rules
+
+    async def __call__(self, request: Request):
+        entries = []
+        for rule, key in self.rules:
+            value = await key(request)
+            if value is not None:
+                entries.append((rule, value))
+
+        retry_after = await rate_limiter.hit(entries)
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(retry_after)}
+            )
+
+
+login_rate_limit = RateLimit(
+    (RateLimitRule("login-email", LOGIN_RATE_LIMIT_PER_EMAIL, LOGIN_RATE_LIMIT_WINDOW), body_field("email")),
+    (RateLimitRule("login-ip", LOGIN_RATE_LIMIT_PER_IP, LOGIN_RATE_LIMIT_WINDOW), client_ip),
+)
+
+register_rate_limit = RateLimit(
+    (RateLimitRule("register-ip", REGISTER_RATE_LIMIT_PER_IP, REGISTER_RATE_LIMIT_WINDOW), client_ip),
+)
@@ -1,7 +1,11 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func 
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func 
 from sqlalchemy.orm import relationship
 from app.database import Base
 
+def _utcnow():
+    return datetime.now(timezone.utc)
+
 class Post(Base):
     __tablename__ = "posts"
 
@@ -9,7 +13,16 @@ class Post(Base):
     title = Column(String)
     content = Column(String)
     # UTC
-    create_at = Column(DateTime(timezone=True), server_default=func.now())
+    # 키셋 커서 비교가 정확하도록 ORM/Core insert는 바인딩 파라미터와 같은 포맷(마이크로초 포함)으로 저장
+    create_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+    # ETag 계산용 (UPDATE 시 자동 갱신)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow, server_default=func.now())
 
     author_id = Column(Integer, ForeignKey("users.id"))
-    author = relationship("User", back_populates="posts")
\ No newline at end of file
+    author = relationship("User", back_populates="posts")
+
+    # 키셋 페이지네이션 (create_at, id) 정렬용 인덱스
+    __table_args__ = (
+        Index("ix_posts_create_at_id", "create_at", "id"),
+        Index("ix_posts_author_id_create_at_id", "author_id", "create_at", "id"),
+    )
\ No newline at end of file
@@ -1,5 +1,9 @@
 
-from pydantic import BaseModel
+from typing import Optional
+from pydantic import BaseModel, Field
+
+# /introspect 한 번에 확인할 수 있는 최대 토큰 수
+INTROSPECT_MAX_TOKENS = 100
 
 
 class LoginRequest(BaseModel):
@@ -12,4 +16,16 @@ class TokenResponse(BaseModel):
     token_type: str
 
 class RefreshRequest(BaseModel):
-    refresh_token: str
\ No newline at end of file
+    refresh_token: str
+
+class IntrospectRequest(BaseModel):
+    tokens: list[str] = Field(..., min_length=1, max_length=INTROSPECT_MAX_TOKENS)
+
+# 비활성 토큰은 active=False만 반환
+class IntrospectResult(BaseModel):
+    active: bool
+    claims: Optional[dict] = None
+    exp: Optional[int] = None
+
+class IntrospectResponse(BaseModel):
+    results: list[IntrospectResult]
\ No newline at end of file
@@ -1,5 +1,8 @@
 from datetime import datetime
-from pydantic import BaseModel 
+from pydantic import BaseModel, Field 
+
+# 일괄 처리 요청당 최대 항목 수
+POST_BULK_MAX_ITEMS = 1000
 
 class PostCreate(BaseModel):
     title: str
@@ -15,6 +18,33 @@ class PostResponse(BaseModel):
     author_id: int
     content: str
     create_at: datetime
+    updated_at: datetime | None = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class PostPage(BaseModel):
+    items: list[PostResponse]
+    next_cursor: str | None = None
+
+class PostBulkUpdateItem(PostUpdate):
+    id: int
+
+class PostBulkCreateRequest(BaseModel):
+    items: list[PostCreate] = Field(..., min_length=1, max_length=POST_BULK_MAX_ITEMS)
+
+class PostBulkUpdateRequest(BaseModel):
+    items: list[PostBulkUpdateItem] = Field(..., min_length=1, max_length=POST_BULK_MAX_ITEMS)
+
+class PostBulkDeleteRequest(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=POST_BULK_MAX_ITEMS)
+
+# 항목별 결과 (status는 단건 API의 HTTP 상태 코드와 동일)
+class PostBulkResult(BaseModel):
+    id: int | None = None
+    status: int
+    detail: str | None = None
+    post: PostResponse | None = None
+
+class PostBulkResponse(BaseModel):
+    results: list[PostBulkResult]
\ No newline at end of file
@@ -9,6 +9,13 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     password: str = Field(..., min_length=8)
 
+# 인증된 사용자 정보 (DB 조회 없이 캐시에서 복원 가능한 최소 필드)
+class UserPrincipal(UserBase):
+    id: int
+
+    class Config:
+        from_attributes=True
+
 class UserResponse(UserBase):
     id: int
     create_at: datetime
@@ -1,34 +1,38 @@
 from datetime import timedelta
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import LoginRequest
-from app.services.token_service import TokenService
-from app.utils.auth import ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token, create_refresh_token
-from app.utils.security import verify_password
+from app.services.token_service import REFRESH_ROTATED, AsyncTokenService
+from app.utils.auth import ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token, create_refresh_token, generate_token_id, get_legacy_token_id, get_token_id, verify_token
+from app.utils.security import password_hasher
 
 
 class AuthService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def authenticate_user(self, login_data: LoginRequest):
+    async def get_user_by_email(self, email: str):
         query = (
             select(User).
-            where(User.email == login_data.email)
+            where(User.email == email)
         )
 
-        user = self.db.execute(query).scalar_one_or_none()
+        return (await self.db.execute(query)).scalar_one_or_none()
 
-        if not user or not verify_password(login_data.password, user.password):
+    # bcrypt 검증은 프로세스 풀에서 실행
+    async def authenticate_user(self, login_data: LoginRequest):
+        user = await self.get_user_by_email(login_data.email)
+
+        if not user or not await password_hasher.verify(login_data.password, user.password):
             return None 
         
         return user
     
-    def create_user_token(self, user: User):
+    async def create_user_token(self, user: User):
         token_data = {
             "username": user.username, 
             "email": user.email, 
@@ -42,11 +46,12 @@ class AuthService:
             expires_delta=access_token_expires
         )
 
+        refresh_token_id = generate_token_id()
         refresh_token = create_refresh_token(
-            data=token_data
+            data={**token_data, "jti": refresh_token_id}
         )
 
-        TokenService.store_refresh_token(user.id, refresh_token)
+        await AsyncTokenService.store_refresh_token(user.id, refresh_token_id)
 
         return {
             "access_token": access_token, 
@@ -54,8 +59,19 @@ class AuthService:
             "token_type": "bearer"
         }
     
-    def refresh_access_token(self, refresh_token: str):
-        payload = verify_password(refresh_token)
+    async def get_user_by_id(self, user_id: int):
+        query=(
+            select(User).
+            where(User.id == user_id)
+        )
+
+        return (await self.db.execute(query)).scalar_one_or_none()
+
+    # refresh token 회전
+    # 사용된 refresh token은 폐기하고 새 refresh token을 함께 발급
+    # 이미 회전된 토큰이 다시 사용되면 같은 family 전체가 폐기됨
+    async def refresh_access_token(self, refresh_token: str):
+        payload = verify_token(refresh_token)
         
         if not payload:
             return None
@@ -64,16 +80,21 @@ class AuthService:
         if not user_id:
             return None 
         
-        is_valid = TokenService.validate_refresh_token(user_id, refresh_token)
-        if not is_valid:
+        refresh_token_id = get_token_id(refresh_token, payload)
+        family = payload.get("fam")
+        new_refresh_token_id = generate_token_id()
+        rotated = await AsyncTokenService.rotate_refresh_token(
+            user_id,
+            refresh_token_id,
+            family,
+            new_refresh_token_id,
+            expires_at=payload.get("exp"),
+            legacy_refresh_token_id=get_legacy_token_id(refresh_token, payload),
+        )
+        if rotated != REFRESH_ROTATED:
             return None
         
-        query=(
-            select(User).
-            where(User.id == user_id)
-        )
-
-        user = self.db.execute(query).scalar_one_or_none()
+        user = await self.get_user_by_id(user_id)
 
         if not user:
             return None
@@ -85,10 +106,14 @@ class AuthService:
         }
 
         access_token = create_access_token(token_data)
+        new_refresh_token = create_refresh_token(
+            data={**token_data, "jti": new_refresh_token_id, "fam": family or refresh_token_id}
+        )
         return {
             "access_token": access_token, 
+            "refresh_token": new_refresh_token,
             "token_type": "bearer",
         }
     
-def get_auth_service(db: Session = Depends(get_db)):
+def get_auth_service(db: AsyncSession = Depends(get_db)):
     return AuthService(db)
\ No newline at end of file
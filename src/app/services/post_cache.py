@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, Optional
+
+import redis.exceptions
+from redis.client import NEVER_DECODE
+
+from app.core.redis_config import get_async_redis
+
+POST_CACHE_PREFIX = "post-cache:"
+POST_CACHE_TTL = 60 * 5
+POST_LIST_CACHE_TTL = 30
+POST_LIST_VERSION_KEY = f"{POST_CACHE_PREFIX}list:version"
+# 버전 키 만료 시간 (삭제되었거나 오래 수정되지 않은 게시글의 버전 키 정리)
+# 항목 TTL보다 충분히 길어야 버전이 0으로 초기화될 때 이전 버전의 항목이 모두 만료되어 있음
+POST_CACHE_VERSION_TTL = 60 * 60 * 24
+
+# 버전 키와 항목을 한 번의 왕복으로 조회
+# 미스면 호출자가 이 버전으로 항목을 저장하므로 버전 키 만료를 연장해 항목보다 먼저 만료되지 않게 함
+READ_VERSIONED_SCRIPT = """
+local version = redis.call('GET', KEYS[1])
+local value = redis.call('GET', ARGV[1] .. (version or '0') .. ARGV[2])
+if version and not value then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return {version or '0', value}
+"""
+
+
+class PostCache:
+    """
+    게시글 조회용 cache-aside 계층
+    직렬화된 응답(JSON)을 버전이 붙은 키에 저장하고, 쓰기 시 버전을 올려 무효화함
+    항목은 디코딩 없이 bytes로 읽고 써서 응답 본문으로 바로 전달함
+    같은 키에 대한 동시 미스는 워커 안에서 하나의 DB 조회로 합침
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._script = None
+
+    def _read_script(self):
+        client = get_async_redis()
+        if self._script is None or self._script.registered_client is not client:
+            self._script = client.register_script(READ_VERSIONED_SCRIPT)
+        return self._script
+
+    # Script 호출은 decode_responses 설정을 따르므로 EVALSHA를 직접 보내 bytes로 받음
+    async def _read_versioned(self, version_key: str, entry_prefix: str, entry_suffix: str) -> tuple[str, Optional[bytes]]:
+        script = self._read_script()
+        client = script.registered_client
+        args = (version_key, entry_prefix, entry_suffix, POST_CACHE_VERSION_TTL)
+        try:
+            version, value = await client.execute_command("EVALSHA", script.sha, 1, *args, **{NEVER_DECODE: True})
+        except redis.exceptions.NoScriptError:
+            script.sha = await client.script_load(script.script)
+            version, value = await client.execute_command("EVALSHA", script.sha, 1, *args, **{NEVER_DECODE: True})
+        return version.decode(), value
+
+    @staticmethod
+    def post_version_key(post_id: int) -> str:
+        return f"{POST_CACHE_PREFIX}post:{post_id}:version"
+
+    async def _coalesce(self, key: str, loader: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[bytes]:
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    @staticmethod
+    async def _not_modified_or_load(loader, not_modified) -> Optional[bytes]:
+        if not_modified is not None and (value := await not_modified()) is not None:
+            return value
+        return await loader()
+
+    async def _get_or_load(
+        self,
+        version_key: str,
+        entry_prefix: str,
+        entry_suffix: str,
+        ttl: int,
+        loader: Callable[[], Awaitable[Optional[bytes]]],
+        not_modified: Optional[Callable[[], Awaitable[Optional[bytes]]]] = None,
+    ) -> Optional[bytes]:
+        try:
+            version, value = await self._read_versioned(version_key, entry_prefix, entry_suffix)
+        except redis.exceptions.RedisError:
+            self.errors += 1
+            return await self._not_modified_or_load(loader, not_modified)
+
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        if not_modified is not None and (value := await not_modified()) is not None:
+            return value
+
+        entry_key = f"{entry_prefix}{version}{entry_suffix}"
+
+        # 버전을 DB 조회 전에 읽었으므로 그 사이 쓰기가 있었다면 이전 버전 키에 저장되어 읽히지 않음
+        async def load_and_store():
+            value = await loader()
+            if value is not None:
+                try:
+                    await get_async_redis().set(entry_key, value, ex=ttl)
+                except redis.exceptions.RedisError:
+                    self.errors += 1
+            return value
+
+        return await self._coalesce(entry_key, load_and_store)
+
+    # not_modified: 캐시 미스 시 본문을 만들기 전에 호출되며, 값을 반환하면 조회/저장 없이 그대로 반환
+    # (클라이언트 ETag가 최신이면 본문 직렬화를 건너뛰는 용도)
+    async def get_post(
+        self,
+        post_id: int,
+        loader: Callable[[], Awaitable[Optional[bytes]]],
+        not_modified: Optional[Callable[[], Awaitable[Optional[bytes]]]] = None,
+    ) -> Optional[bytes]:
+        return await self._get_or_load(
+            self.post_version_key(post_id),
+            f"{POST_CACHE_PREFIX}post:{post_id}:v",
+            "",
+            POST_CACHE_TTL,
+            loader,
+            not_modified,
+        )
+
+    async def get_post_list(
+        self,
+        params: tuple,
+        loader: Callable[[], Awaitable[Optional[bytes]]],
+        not_modified: Optional[Callable[[], Awaitable[Optional[bytes]]]] = None,
+    ) -> Optional[bytes]:
+        digest = hashlib.sha1(repr(params).encode()).hexdigest()
+        return await self._get_or_load(
+            POST_LIST_VERSION_KEY,
+            f"{POST_CACHE_PREFIX}list:v",
+            f":{digest}",
+            POST_LIST_CACHE_TTL,
+            loader,
+            not_modified,
+        )
+
+    # 목록은 어떤 쓰기든 영향을 받으므로 게시글 버전과 함께 목록 버전도 올림
+    async def invalidate(self, post_ids: list[int] = ()):
+        try:
+            async with get_async_redis().pipeline(transaction=False) as pipe:
+                for version_key in [*map(self.post_version_key, set(post_ids)), POST_LIST_VERSION_KEY]:
+                    pipe.incr(version_key)
+                    pipe.expire(version_key, POST_CACHE_VERSION_TTL)
+                await pipe.execute()
+        except redis.exceptions.RedisError:
+            self.errors += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+post_cache = PostCache()
@@ -0,0 +1,102 @@
+"""
+SQLite FTS5 기반 게시글 전문 검색
+posts를 외부 content 테이블로 사용하는 posts_fts 가상 테이블과 동기화 트리거를 관리함
+
+기존 데이터 색인 재구성
+    cd src && python -m app.services.post_search --rebuild
+"""
+import argparse
+
+from sqlalchemy import func, inspect, literal_column, select, text
+from sqlalchemy.engine import Connection
+
+from app.database import DATABASE_MODE, async_read_engine, engine, read_engine
+
+POST_SEARCH_TABLE = "posts_fts"
+# 제목 일치에 본문보다 높은 가중치
+POST_SEARCH_WEIGHTS = (10.0, 1.0)
+# 한글 부분 일치가 필요하면 'trigram' (SQLite 3.34+, 3글자 이상 검색어)
+POST_SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+POST_SEARCH_MAX_TERMS = 16
+
+POST_SEARCH_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {POST_SEARCH_TABLE}
+    USING fts5(title, content, content='posts', content_rowid='id', tokenize='{POST_SEARCH_TOKENIZER}')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {POST_SEARCH_TABLE}_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO {POST_SEARCH_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {POST_SEARCH_TABLE}_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO {POST_SEARCH_TABLE}({POST_SEARCH_TABLE}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {POST_SEARCH_TABLE}_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO {POST_SEARCH_TABLE}({POST_SEARCH_TABLE}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {POST_SEARCH_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+)
+
+
+def is_search_supported() -> bool:
+    # 검색은 조회 전용 engine에서 실행됨
+    active_engine = read_engine if DATABASE_MODE == "sync" else async_read_engine
+    return active_engine.dialect.name == "sqlite"
+
+# 가상 테이블과 트리거 생성
+# 테이블을 새로 만든 경우 기존 게시글을 색인하도록 rebuild 수행
+def init_post_search(conn: Connection) -> bool:
+    if conn.dialect.name != "sqlite":
+        return False
+
+    created = not inspect(conn).has_table(POST_SEARCH_TABLE)
+    for statement in POST_SEARCH_DDL:
+        conn.execute(text(statement))
+    if created:
+        rebuild_post_search(conn)
+    return created
+
+# posts 전체로 색인 재구성 (트리거 도입 전 데이터 또는 색인 손상 시)
+def rebuild_post_search(conn: Connection):
+    conn.execute(text(f"INSERT INTO {POST_SEARCH_TABLE}({POST_SEARCH_TABLE}) VALUES ('rebuild')"))
+
+
+# 사용자 입력을 FTS5 질의로 변환
+# 각 단어를 따옴표로 감싸 연산자/구문 오류 없이 모든 단어를 포함(AND)하는 문서를 찾음
+def to_fts_query(query: str) -> str | None:
+    terms = query.split()[:POST_SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+# (게시글 id, bm25 점수) CTE, 점수는 작을수록 관련도가 높음
+# MATERIALIZED로 점수를 한 번만 계산한 뒤 키셋 조건과 정렬에 사용
+def search_matches(fts_query: str):
+    table = literal_column(POST_SEARCH_TABLE)
+    return (
+        select(
+            literal_column(f"{POST_SEARCH_TABLE}.rowid").label("id"),
+            func.bm25(table, *POST_SEARCH_WEIGHTS).label("score"),
+        )
+        .select_from(text(POST_SEARCH_TABLE))
+        .where(text(f"{POST_SEARCH_TABLE} MATCH :fts_query").bindparams(fts_query=fts_query))
+        .cte("search_matches")
+        .prefix_with("MATERIALIZED")
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rebuild", action="store_true", help="posts 전체로 검색 색인 재구성")
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        created = init_post_search(conn)
+        if args.rebuild and not created:
+            rebuild_post_search(conn)
+    print("post search index ready")
@@ -1,22 +1,68 @@
-from sqlalchemy import select
+import os
+from datetime import datetime, timezone
+from sqlalchemy import delete, func, insert, select, tuple_, update
 
 from fastapi import Depends, HTTPException
-from app.models.user import User
-from app.schemas.post import PostCreate, PostUpdate
-from sqlalchemy.orm import Session
-from app.database import get_db
+from app.schemas.post import PostBulkUpdateItem, PostCreate, PostPage, PostResponse, PostUpdate
+from app.schemas.user import UserPrincipal
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db, get_read_db
 
 from app.models.post import Post
 from app.schemas.post import PostCreate
+from app.services.post_cache import post_cache
+from app.services.post_search import is_search_supported, search_matches, to_fts_query
+from app.utils.etag import etag_matches, make_etag
+from app.utils.fast_json import dumps
+from app.utils.pagination import POSTS_PAGE_DEFAULT_LIMIT, InvalidCursorError, decode_cursor, encode_cursor
+
+POST_EXPORT_BATCH_SIZE = 1000
+# 목록 응답을 PostPage 모델 대신 행 튜플에서 바로 인코딩 (orjson 설치 시 가장 빠름)
+POST_LIST_FAST_JSON = os.getenv("POST_LIST_FAST_JSON", "false").lower() == "true"
+# PostResponse 필드 순서와 같아야 응답 JSON이 동일함
+POST_PAGE_COLUMNS = (Post.id, Post.title, Post.author_id, Post.content, Post.create_at, Post.updated_at)
+POST_PAGE_FIELDS = tuple(column.key for column in POST_PAGE_COLUMNS)
+BULK_ERROR_DETAILS = {
+    403: "접근 권한이 없습니다.",
+    404: "게시글을 찾을 수 없습니다.",
+}
+
+# 캐시에는 ETag와 본문을 함께 저장해 캐시 적중 시 바로 304를 판단할 수 있게 함
+def _pack_cached(etag: str, body: bytes) -> bytes:
+    return etag.encode() + b"\n" + body
+
+def _unpack_cached(value: bytes) -> tuple[str, bytes]:
+    etag, _, body = value.partition(b"\n")
+    return etag.decode(), body
+
+# updated_at이 없는 이전 행은 create_at을 버전으로 사용 (ORM 객체와 행 튜플 모두 가능)
+def _post_version(post) -> datetime:
+    return post.updated_at or post.create_at
+
+def _post_etag(post_id: int, version: datetime) -> str:
+    return make_etag("post", post_id, version.isoformat())
+
+# 목록 ETag는 페이지 행들의 집계(개수, id 합, 최대 버전)로 계산
+# 본문을 만든 행에서 계산하든 집계 쿼리로 계산하든 같은 값이 나와야 함
+def _posts_etag(limit: int, cursor: str | None, author_id: int | None, count: int, id_sum: int | None, version: datetime | None) -> str:
+    return make_etag("posts", limit, cursor, author_id, count, id_sum or 0, version.isoformat() if version else "")
+
+# 클라이언트 ETag가 최신이면 본문 없이 ETag만 캐시 형식으로 반환 (라우터에서 304로 응답)
+def _not_modified(if_none_match: str | None, etag: str | None) -> bytes | None:
+    if etag is None or not etag_matches(if_none_match, etag):
+        return None
+    return _pack_cached(etag, b"")
 
 class PostService:
-    def __init__(self, db: Session):
+    # 조회(목록/상세/검색/내보내기)는 read_db, 그 외는 db 사용
+    def __init__(self, db: AsyncSession, read_db: AsyncSession | None = None):
         self.db = db
+        self.read_db = read_db or db
 
     """
     게시글 생성
     """
-    def create_post(self, post: PostCreate, user: User):
+    async def create_post(self, post: PostCreate, user: UserPrincipal):
 
 
         created_post = Post(**post.model_dump())
@@ -25,47 +71,233 @@ class PostService:
         created_post.author_id = author_id
         
         self.db.add(created_post)
-        self.db.commit()
-        self.db.refresh(created_post)
+        await self.db.commit()
+        await self.db.refresh(created_post)
+        await post_cache.invalidate()
 
         return created_post
     
 
     """
-    전체 게시글 조회
+    게시글 목록 조회
+    (create_at, id) 키셋 페이지네이션으로 페이지 깊이와 관계없이 인덱스 범위 조회 한 번으로 처리
+    """
+    async def get_posts(self, limit: int = POSTS_PAGE_DEFAULT_LIMIT, cursor: str | None = None, author_id: int | None = None):
+        query = self._posts_page_query((Post,), limit, cursor, author_id)
+        posts = (await self.read_db.execute(query)).scalars().all()
+        return self._posts_page(posts, limit)
+
     """
-    def get_posts(self):
+    게시글 목록 조회 (행 튜플)
+    ORM 객체 대신 PostResponse 필드 컬럼만 조회해 바로 JSON으로 인코딩할 때 사용
+    """
+    async def get_post_rows(self, limit: int = POSTS_PAGE_DEFAULT_LIMIT, cursor: str | None = None, author_id: int | None = None):
+        query = self._posts_page_query(POST_PAGE_COLUMNS, limit, cursor, author_id)
+        rows = (await self.read_db.execute(query)).all()
+        return self._posts_page(rows, limit)
+
+    def _posts_page_query(self, columns, limit: int, cursor: str | None, author_id: int | None):
         query = (
-            select(Post). 
-            order_by(Post.create_at.desc())
+            select(*columns). 
+            order_by(Post.create_at.desc(), Post.id.desc()).
+            limit(limit + 1)
         )
-        posts = self.db.execute(query).scalars().all()
 
-        return posts
+        if author_id is not None:
+            query = query.where(Post.author_id == author_id)
+
+        after = decode_cursor(cursor, 2)
+        if after is not None:
+            try:
+                after_create_at, after_id = datetime.fromisoformat(after[0]), int(after[1])
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError(cursor) from e
+            query = query.where(tuple_(Post.create_at, Post.id) < tuple_(after_create_at, after_id))
+
+        return query
+
+    # limit + 1개를 조회해 다음 페이지 존재 여부를 판단
+    def _posts_page(self, posts, limit: int):
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_cursor([posts[-1].create_at.isoformat(), posts[-1].id])
+
+        return posts, next_cursor
     
+    """
+    게시글 검색
+    FTS5 bm25 점수순(동점은 id순), (점수, id) 키셋 페이지네이션
+    """
+    async def search_posts(self, query: str, limit: int = POSTS_PAGE_DEFAULT_LIMIT, cursor: str | None = None, author_id: int | None = None):
+        if not is_search_supported():
+            raise HTTPException(status_code=501, detail="검색을 지원하지 않는 데이터베이스입니다.")
+
+        after = decode_cursor(cursor, 2)
+        fts_query = to_fts_query(query)
+        if fts_query is None:
+            return [], None
+
+        matches = search_matches(fts_query)
+        search_query = (
+            select(Post, matches.c.score).
+            join(matches, matches.c.id == Post.id).
+            order_by(matches.c.score, Post.id).
+            limit(limit + 1)
+        )
+
+        if author_id is not None:
+            search_query = search_query.where(Post.author_id == author_id)
+
+        if after is not None:
+            try:
+                after_score, after_id = float(after[0]), int(after[1])
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError(cursor) from e
+            search_query = search_query.where(tuple_(matches.c.score, Post.id) > tuple_(after_score, after_id))
+
+        rows = (await self.read_db.execute(search_query)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1].score, rows[-1].Post.id])
+
+        return [row.Post for row in rows], next_cursor
+
+    """
+    게시글 목록 조회 (캐시)
+    (ETag, 직렬화된 PostPage JSON bytes)를 반환
+    If-None-Match가 있으면 캐시 미스 시 집계 쿼리로 ETag만 먼저 계산해 일치하면 본문을 만들지 않음
+    """
+    async def get_posts_json(
+        self, 
+        limit: int = POSTS_PAGE_DEFAULT_LIMIT, 
+        cursor: str | None = None, 
+        author_id: int | None = None, 
+        if_none_match: str | None = None
+    ) -> tuple[str, bytes]:
+        # 잘못된 커서는 캐시 조회 전에 거름
+        decode_cursor(cursor, 2)
+
+        async def not_modified():
+            if not if_none_match:
+                return None
+            return _not_modified(if_none_match, await self.get_posts_etag(limit, cursor, author_id))
+
+        async def load():
+            if POST_LIST_FAST_JSON:
+                posts, next_cursor = await self.get_post_rows(limit, cursor, author_id)
+                page = {"items": [dict(zip(POST_PAGE_FIELDS, row)) for row in posts], "next_cursor": next_cursor}
+                body = dumps(page)
+            else:
+                posts, next_cursor = await self.get_posts(limit, cursor, author_id)
+                body = PostPage(items=posts, next_cursor=next_cursor).model_dump_json().encode()
+
+            etag = _posts_etag(
+                limit, cursor, author_id, 
+                len(posts), 
+                sum(post.id for post in posts), 
+                max((_post_version(post) for post in posts), default=None)
+            )
+            return _pack_cached(etag, body)
+
+        return _unpack_cached(await post_cache.get_post_list((limit, cursor, author_id), load, not_modified))
+
+    # 페이지 행을 읽지 않고 (개수, id 합, 최대 버전) 집계만 조회
+    async def get_posts_etag(self, limit: int = POSTS_PAGE_DEFAULT_LIMIT, cursor: str | None = None, author_id: int | None = None) -> str:
+        version = func.coalesce(Post.updated_at, Post.create_at).label("version")
+        page = self._posts_page_query((Post.id, version), limit, cursor, author_id).limit(limit).subquery()
+        query = select(func.count(), func.sum(page.c.id), func.max(page.c.version))
+
+        count, id_sum, max_version = (await self.read_db.execute(query)).one()
+        return _posts_etag(limit, cursor, author_id, count, id_sum, max_version)
+
+    """
+    게시글 내보내기
+    ORM 객체 없이 필요한 컬럼만 서버 측 커서로 읽어 batch_size 단위로 반환
+    """
+    async def stream_posts(
+        self, 
+        author_id: int | None = None, 
+        created_from: datetime | None = None, 
+        created_to: datetime | None = None, 
+        batch_size: int = POST_EXPORT_BATCH_SIZE
+    ):
+        query = (
+            select(Post.id, Post.title, Post.author_id, Post.content, Post.create_at).
+            order_by(Post.id).
+            execution_options(yield_per=batch_size)
+        )
+
+        if author_id is not None:
+            query = query.where(Post.author_id == author_id)
+        if created_from is not None:
+            query = query.where(Post.create_at >= created_from)
+        if created_to is not None:
+            query = query.where(Post.create_at < created_to)
+
+        result = await self.read_db.stream(query)
+        try:
+            async for rows in result.partitions(batch_size):
+                yield rows
+        finally:
+            await result.close()
+
     """
     특정 게시글 조회
     """
-    def get_post(self, post_id: int):
+    async def get_post(self, post_id: int):
         
         query = (
             select(Post).
             where(Post.id == post_id)
         )
-        post = self.db.execute(query).scalar_one_or_none()
+        post = (await self.read_db.execute(query)).scalar_one_or_none()
 
         return post
     
+    """
+    특정 게시글 조회 (캐시)
+    (ETag, 직렬화된 PostResponse JSON bytes)를 반환하며 게시글이 없으면 None
+    If-None-Match가 있으면 캐시 미스 시 버전 컬럼만 먼저 조회해 일치하면 본문을 만들지 않음
+    """
+    async def get_post_json(self, post_id: int, if_none_match: str | None = None) -> tuple[str, bytes] | None:
+        async def not_modified():
+            if not if_none_match:
+                return None
+            return _not_modified(if_none_match, await self.get_post_etag(post_id))
+
+        async def load():
+            post = await self.get_post(post_id)
+            if post is None:
+                return None
+
+            etag = _post_etag(post.id, _post_version(post))
+            return _pack_cached(etag, PostResponse.model_validate(post).model_dump_json().encode())
+
+        cached = await post_cache.get_post(post_id, load, not_modified)
+        return None if cached is None else _unpack_cached(cached)
+
+    async def get_post_etag(self, post_id: int) -> str | None:
+        query = (
+            select(Post.id, Post.create_at, Post.updated_at).
+            where(Post.id == post_id)
+        )
+        row = (await self.read_db.execute(query)).one_or_none()
+
+        return None if row is None else _post_etag(row.id, _post_version(row))
+
     """
     게시글 수정
     작성자만 수정 가능
     """
-    def update_post(self, post_id: int, post_update: PostUpdate, user: User):
+    async def update_post(self, post_id: int, post_update: PostUpdate, user: UserPrincipal):
         query = (
             select(Post).
             where(Post.id == post_id)
         )
-        post = self.db.execute(query).scalar_one_or_none()
+        post = (await self.db.execute(query)).scalar_one_or_none()
 
         if post is None:
             return None
@@ -85,8 +317,9 @@ class PostService:
         for key, value in update_dict.items():
             setattr(post, key, value)
 
-        self.db.commit()
-        self.db.refresh(post)
+        await self.db.commit()
+        await self.db.refresh(post)
+        await post_cache.invalidate([post_id])
 
         return post
     
@@ -94,12 +327,12 @@ class PostService:
     게시글 삭제
     작성자만 삭제 가능
     """
-    def delete_post(self, post_id: int, user: User):
+    async def delete_post(self, post_id: int, user: UserPrincipal):
         query = (
             select(Post).
             where(Post.id == post_id)
         )
-        post = self.db.execute(query).scalar_one_or_none()
+        post = (await self.db.execute(query)).scalar_one_or_none()
 
         if post is None:
             return False
@@ -110,10 +343,108 @@ class PostService:
                 detail="접근 권한이 없습니다."
             )
         
-        self.db.delete(post)
-        self.db.commit()
+        await self.db.delete(post)
+        await self.db.commit()
+        await post_cache.invalidate([post_id])
 
         return True
 
-def get_post_service(db: Session = Depends(get_db)):
-    return PostService(db)
\ No newline at end of file
+    """
+    작성자 확인 (일괄 처리용)
+    요청한 게시글들의 작성자를 한 번의 조회로 확인해 항목별 상태 코드를 반환
+    """
+    async def _check_authors(self, post_ids: list[int], user: UserPrincipal) -> dict[int, int]:
+        query = (
+            select(Post.id, Post.author_id).
+            where(Post.id.in_(set(post_ids)))
+        )
+        authors = dict((await self.db.execute(query)).all())
+
+        return {
+            post_id: 404 if post_id not in authors else 403 if authors[post_id] != user.id else 200
+            for post_id in post_ids
+        }
+
+    async def _get_posts_by_ids(self, post_ids) -> dict[int, Post]:
+        query = (
+            select(Post).
+            where(Post.id.in_(post_ids)).
+            execution_options(populate_existing=True)
+        )
+        return {post.id: post for post in (await self.db.execute(query)).scalars()}
+
+    """
+    게시글 일괄 생성
+    한 번의 INSERT ... RETURNING과 한 번의 commit으로 처리
+    """
+    async def create_posts(self, posts: list[PostCreate], user: UserPrincipal):
+        query = insert(Post).returning(Post, sort_by_parameter_order=True)
+        values = [{**post.model_dump(), "author_id": user.id} for post in posts]
+
+        created_posts = (await self.db.execute(query, values)).scalars().all()
+        await self.db.commit()
+        await post_cache.invalidate()
+
+        return [{"id": post.id, "status": 201, "post": post} for post in created_posts]
+
+    """
+    게시글 일괄 수정
+    작성자만 수정 가능하며 권한이 없거나 없는 게시글은 항목별 결과로 반환
+    """
+    async def update_posts(self, items: list[PostBulkUpdateItem], user: UserPrincipal):
+        statuses = await self._check_authors([item.id for item in items], user)
+
+        values = [
+            {"id": item.id, **item.model_dump(exclude={"id"}, exclude_none=True)}
+            for item in items
+            if statuses[item.id] == 200
+        ]
+        changed = [value for value in values if len(value) > 1]
+        if changed:
+            updated_at = datetime.now(timezone.utc)
+            for value in changed:
+                value["updated_at"] = updated_at
+            await self.db.execute(update(Post), changed)
+            await self.db.commit()
+            await post_cache.invalidate([value["id"] for value in changed])
+
+        posts = await self._get_posts_by_ids([value["id"] for value in values])
+
+        results = []
+        for item in items:
+            status = statuses[item.id]
+            if status == 200 and item.id in posts:
+                results.append({"id": item.id, "status": 200, "post": posts[item.id]})
+            else:
+                # 확인 이후 다른 요청에서 삭제된 경우도 404로 처리
+                status = 404 if status == 200 else status
+                results.append({"id": item.id, "status": status, "detail": BULK_ERROR_DETAILS[status]})
+
+        return results
+
+    """
+    게시글 일괄 삭제
+    작성자만 삭제 가능
+    """
+    async def delete_posts(self, post_ids: list[int], user: UserPrincipal):
+        statuses = await self._check_authors(post_ids, user)
+
+        allowed = {post_id for post_id, status in statuses.items() if status == 200}
+        if allowed:
+            query = (
+                delete(Post).
+                where(Post.id.in_(allowed)).
+                execution_options(synchronize_session=False)
+            )
+            await self.db.execute(query)
+            await self.db.commit()
+            await post_cache.invalidate(list(allowed))
+
+        return [
+            {"id": post_id, "status": statuses[post_id], "detail": BULK_ERROR_DETAILS.get(statuses[post_id])}
+            for post_id in post_ids
+        ]
+
+# 세션은 첫 쿼리 때 연결을 얻으므로 사용하지 않는 쪽은 연결을 점유하지 않음
+def get_post_service(db: AsyncSession = Depends(get_db), read_db: AsyncSession = Depends(get_read_db)):
+    return PostService(db, read_db)
\ No newline at end of file
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+import os
+import threading
+import time
+from typing import Optional
+
+from app.core.redis_config import get_async_redis, redis_client
+from app.schemas.user import UserPrincipal
+
+PRINCIPAL_PREFIX = "principal:"
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "30"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "100000"))
+# 워커 간 공유 캐시 (Redis hash) 사용 여부
+PRINCIPAL_CACHE_USE_REDIS = os.getenv("PRINCIPAL_CACHE_USE_REDIS", "false").lower() == "true"
+PRINCIPAL_REDIS_EXPIRY = 60 * 10
+
+
+class PrincipalCache:
+    """
+    user_id -> UserPrincipal 캐시
+    로컬 TTL 캐시를 먼저 확인하고, 설정된 경우 Redis hash를 공유 캐시로 사용
+    UserService의 쓰기 작업에서 invalidate 해야 함
+    """
+    def __init__(
+        self,
+        ttl: float = PRINCIPAL_CACHE_TTL,
+        max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES,
+        use_redis: bool = PRINCIPAL_CACHE_USE_REDIS,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.use_redis = use_redis
+        self._entries: OrderedDict[int, tuple[UserPrincipal, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"{PRINCIPAL_PREFIX}{user_id}"
+
+    @staticmethod
+    def _from_hash(values: dict) -> Optional[UserPrincipal]:
+        if not values:
+            return None
+        return UserPrincipal(id=int(values["id"]), email=values["email"], username=values["username"])
+
+    def get_local(self, user_id: int) -> Optional[UserPrincipal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+
+            principal, cached_at = entry
+            if time.monotonic() - cached_at > self.ttl:
+                del self._entries[user_id]
+                return None
+
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def set_local(self, principal: UserPrincipal):
+        with self._lock:
+            self._entries[principal.id] = (principal, time.monotonic())
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, user_id: int) -> Optional[UserPrincipal]:
+        principal = self.get_local(user_id)
+        if principal is None and self.use_redis:
+            principal = self._from_hash(redis_client.hgetall(self._key(user_id)))
+            if principal is not None:
+                self.set_local(principal)
+        return principal
+
+    async def get_async(self, user_id: int) -> Optional[UserPrincipal]:
+        principal = self.get_local(user_id)
+        if principal is None and self.use_redis:
+            principal = self._from_hash(await get_async_redis().hgetall(self._key(user_id)))
+            if principal is not None:
+                self.set_local(principal)
+        return principal
+
+    def set(self, principal: UserPrincipal):
+        self.set_local(principal)
+        if self.use_redis:
+            with redis_client.pipeline() as pipe:
+                pipe.hset(self._key(principal.id), mapping=principal.model_dump())
+                pipe.expire(self._key(principal.id), PRINCIPAL_REDIS_EXPIRY)
+                pipe.execute()
+
+    async def set_async(self, principal: UserPrincipal):
+        self.set_local(principal)
+        if self.use_redis:
+            async with get_async_redis().pipeline() as pipe:
+                pipe.hset(self._key(principal.id), mapping=principal.model_dump())
+                pipe.expire(self._key(principal.id), PRINCIPAL_REDIS_EXPIRY)
+                await pipe.execute()
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+        if self.use_redis:
+            redis_client.delete(self._key(user_id))
+
+    async def invalidate_async(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+        if self.use_redis:
+            await get_async_redis().delete(self._key(user_id))
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,103 @@
+import math
+import os
+import secrets
+import time
+
+import redis.exceptions
+
+from app.core.metrics import instrumented
+from app.core.redis_config import get_async_redis, redis_breaker
+
+RATE_LIMIT_PREFIX = "rate-limit:"
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+
+# 여러 키의 sliding window(요청 시각 sorted set)를 한 번의 왕복으로 확인하고 기록
+# 하나라도 한도를 넘으면 아무 것도 기록하지 않고 가장 긴 대기 시간(ms)을 반환
+# KEYS: 제한 키 목록 / ARGV: 현재 시각(ms), 요청 id, (한도, 창 크기(ms)) 키 개수만큼
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[1 + i * 2])
+    local window = tonumber(ARGV[2 + i * 2])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        retry_after = math.max(retry_after, tonumber(oldest[2]) + window - now)
+    end
+end
+if retry_after > 0 then
+    return retry_after
+end
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, ARGV[2])
+    redis.call('PEXPIRE', key, ARGV[2 + i * 2])
+end
+return 0
+"""
+
+
+class RateLimitRule:
+    def __init__(self, name: str, limit: int, window_seconds: float):
+        # limit이 0 이하면 스크립트에서 가장 오래된 항목이 없어 재시도 시간을 계산할 수 없음
+        if limit <= 0:
+            raise ValueError(f"Rate limit must be positive: {name}")
+        if window_seconds <= 0:
+            raise ValueError(f"Rate limit window must be positive: {name}")
+        self.name = name
+        self.limit = limit
+        self.window_seconds = window_seconds
+
+
+class RateLimiter:
+    """
+    Redis sliding window log 기반 요청 제한
+    모든 규칙을 하나의 Lua 스크립트로 확인하므로 요청당 Redis 왕복은 한 번
+    Redis 장애 시에는 제한하지 않음 (로그인 자체를 막지 않도록)
+    """
+    def __init__(self, prefix: str = RATE_LIMIT_PREFIX, enabled: bool = RATE_LIMIT_ENABLED):
+        self.prefix = prefix
+        self.enabled = enabled
+        self.rejected = 0
+        self.errors = 0
+        self._script = None
+
+    def _sliding_window_script(self):
+        client = get_async_redis()
+        if self._script is None or self._script.registered_client is not client:
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+        return self._script
+
+    # 허용되면 0, 초과하면 다시 시도할 수 있을 때까지의 초 (올림)
+    @instrumented("redis", "RateLimiter.hit")
+    async def hit(self, entries: list[tuple[RateLimitRule, str]]) -> int:
+        if not self.enabled or not entries or not redis_breaker.allow():
+            return 0
+
+        keys = [f"{self.prefix}{rule.name}:{value}" for rule, value in entries]
+        args = [int(time.time() * 1000), secrets.token_hex(8)]
+        for rule, _ in entries:
+            args.extend([rule.limit, int(rule.window_seconds * 1000)])
+
+        try:
+            retry_after_ms = await self._sliding_window_script()(keys=keys, args=args)
+        except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+            redis_breaker.record_failure()
+            self.errors += 1
+            return 0
+        except redis.exceptions.RedisError:
+            redis_breaker.release()
+            self.errors += 1
+            return 0
+        except BaseException:
+            redis_breaker.release()
+            raise
+        redis_breaker.record_success()
+
+        if retry_after_ms:
+            self.rejected += 1
+            return max(1, math.ceil(int(retry_after_ms) / 1000))
+        return 0
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+
+from fastapi import FastAPI
+import redis.exceptions
+
+from app.core.redis_config import get_async_redis
+from app.utils.bloom import BloomFilter
+
+REVOCATION_FILTER_CAPACITY = 1_000_000
+REVOCATION_FILTER_ERROR_RATE = 0.001
+# 만료된 항목은 Bloom filter에서 삭제할 수 없으므로 주기적으로 keyspace에서 재구성
+REVOCATION_FILTER_REBUILD_SECONDS = 600
+REVOCATION_FILTER_RETRY_SECONDS = 1
+
+
+class RevocationFilter:
+    """
+    워커별 폐기 토큰 Bloom filter
+    시작 시 블랙리스트 keyspace에서 구성되고 pub/sub 채널로 다른 워커/노드의 폐기를 반영함
+    filter에 없는 토큰은 Redis 조회 없이 폐기되지 않은 것으로 판단
+    """
+    def __init__(
+        self,
+        key_prefix: str,
+        channel: str,
+        capacity: int = REVOCATION_FILTER_CAPACITY,
+        error_rate: float = REVOCATION_FILTER_ERROR_RATE,
+    ):
+        self.key_prefix = key_prefix
+        self.channel = channel
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # 구독이 끊겨 있는 동안에는 모든 조회를 Redis로 보냄
+        self.ready = False
+        # 마지막으로 Redis와 동기화된 것이 확인된 시각 (monotonic)
+        self._synced_at: float | None = None
+        self._filter = BloomFilter(capacity, error_rate)
+        self._pending: list[str] | None = None
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    def add(self, token_id: str):
+        with self._lock:
+            self._filter.add(token_id)
+            if self._pending is not None:
+                self._pending.append(token_id)
+
+    def might_contain(self, token_id: str) -> bool:
+        if not self.ready:
+            return True
+        return token_id in self._filter
+
+    # Redis 장애 시(fail-open) 마지막으로 동기화된 filter 내용으로 판단
+    def snapshot_contains(self, token_id: str) -> bool:
+        return token_id in self._filter
+
+    def snapshot_age(self) -> float:
+        if self._synced_at is None:
+            return float("inf")
+        return time.monotonic() - self._synced_at
+
+    async def rebuild(self):
+        # 재구성 중 들어온 폐기는 pending에 모아 새 filter에 다시 반영
+        with self._lock:
+            self._pending = []
+
+        rebuilt = BloomFilter(self.capacity, self.error_rate)
+        try:
+            async for key in get_async_redis().scan_iter(match=f"{self.key_prefix}*", count=1000):
+                rebuilt.add(key[len(self.key_prefix):])
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            for token_id in self._pending:
+                rebuilt.add(token_id)
+            self._filter = rebuilt
+            self._pending = None
+
+    async def _listen(self):
+        while True:
+            pubsub = None
+            try:
+                pubsub = get_async_redis().pubsub()
+                # 구독 후 재구성해야 그 사이의 폐기를 놓치지 않음
+                await pubsub.subscribe(self.channel)
+                await self.rebuild()
+                self.ready = True
+                rebuilt_at = time.monotonic()
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        self.add(message["data"])
+                    self._synced_at = time.monotonic()
+
+                    if time.monotonic() - rebuilt_at > REVOCATION_FILTER_REBUILD_SECONDS:
+                        await self.rebuild()
+                        rebuilt_at = time.monotonic()
+            except (redis.exceptions.RedisError, RuntimeError):
+                self.ready = False
+                await asyncio.sleep(REVOCATION_FILTER_RETRY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    await pubsub.aclose()
+
+    def init_app(self, app: FastAPI):
+        @app.on_event("startup")
+        async def startup_revocation_filter():
+            self._task = asyncio.create_task(self._listen())
+
+        @app.on_event("shutdown")
+        async def shutdown_revocation_filter():
+            self.ready = False
+            if self._task is not None:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+                self._task = None
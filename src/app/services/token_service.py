@@ -1,45 +1,597 @@
-from datetime import timedelta
-from app.core.redis_config import redis_client
+import asyncio
+from collections import OrderedDict
+import functools
+import inspect
+import math
+import threading
+import time
+from typing import Optional
+from fastapi import FastAPI, HTTPException
+import redis.exceptions
+from app.core import redis_config
+from app.core.metrics import instrument_methods
+from app.core.redis_config import get_async_redis, redis_breaker, redis_client
+from app.services.revocation_filter import RevocationFilter
+from app.utils.auth import ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
 
 TOKEN_BLACKLIST_PREFIX = "blacklist:"
-REFRESH_TOKEN_PREFIX = "refresh:"
+TOKEN_BLACKLIST_CHANNEL = "blacklist-events"
+# 사용자별 refresh token id sorted set (score: 만료 시각)
+REFRESH_TOKEN_PREFIX = "refresh-tokens:"
+# 이전 set 형식, 남은 키가 만료될 때까지 검증/삭제에만 사용
+LEGACY_REFRESH_TOKEN_PREFIX = "refresh:"
+# 회전으로 폐기된 refresh token id (재사용 감지용, score: 원래 만료 시각)
+REFRESH_TOKEN_ROTATED_PREFIX = "refresh-rotated:"
+REFRESH_TOKEN_LIFETIME = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+# 사용자별 최대 세션 수, 초과 시 가장 먼저 만료되는(가장 오래된) 세션부터 제거
+REFRESH_TOKEN_MAX_SESSIONS = 20
+REFRESH_TOKEN_MAX_ROTATED = REFRESH_TOKEN_MAX_SESSIONS * 10
+# 만료된 항목 정리 주기 (로그인하지 않는 사용자의 키 정리용, 워커 하나만 실행)
+REFRESH_TOKEN_SWEEP_SECONDS = 60 * 60
+REFRESH_TOKEN_SWEEP_LOCK = "refresh-tokens-sweep-lock"
+REFRESH_TOKEN_SWEEP_BATCH = 1000
 DEFAULT_TOKEN_EXPIRY = 60 * 30
+USER_EPOCH_PREFIX = "epoch:"
+# epoch 이전에 발급된 access token이 모두 만료될 때까지만 유지
+USER_EPOCH_EXPIRY = ACCESS_TOKEN_EXPIRE_MINUTES * 60 + 60
+# 다른 워커의 전체 로그아웃은 최대 이 시간 뒤에 반영됨
+USER_EPOCH_CACHE_TTL = 5
+USER_EPOCH_CACHE_MAX_ENTRIES = 100_000
+
+
+class UserEpochCache:
+    """
+    사용자별 토큰 epoch(not-before)의 로컬 TTL 캐시
+    epoch이 없는 사용자도 0으로 캐시해 요청마다 Redis를 조회하지 않음
+    """
+    def __init__(self, ttl: float = USER_EPOCH_CACHE_TTL, max_entries: int = USER_EPOCH_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[float]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+
+            # 만료된 항목도 Redis 장애 시 get_stale로 쓸 수 있도록 남겨둠 (max_entries로 제한)
+            epoch, cached_at = entry
+            if time.monotonic() - cached_at > self.ttl:
+                return None
+            return epoch
+
+    def get_stale(self, user_id: int) -> Optional[float]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            return entry[0] if entry is not None else None
+
+    def set(self, user_id: int, epoch: float):
+        with self._lock:
+            self._entries[user_id] = (epoch, time.monotonic())
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+user_epoch_cache = UserEpochCache()
+
+def _new_user_epoch() -> float:
+    return math.ceil(time.time() * 1000) / 1000
+
+def _is_issued_before(payload: dict, epoch: float) -> bool:
+    return epoch > 0 and payload.get("iat", 0) < epoch
+
+def _refresh_token_expiry(expires_at: Optional[float]) -> float:
+    return expires_at if expires_at is not None else time.time() + REFRESH_TOKEN_LIFETIME
+
+# 저장소의 refresh token member
+# 로그인 토큰은 id 그대로, 회전된 토큰은 "<family>:<id>" (family 단위 폐기용)
+def refresh_token_member(token_id: str, family: Optional[str] = None) -> str:
+    return f"{family}:{token_id}" if family else token_id
+
+def _rotate_refresh_token_args(
+    user_id: int,
+    token_id: str,
+    family: Optional[str],
+    new_token_id: str,
+    expires_at: Optional[float],
+    new_expires_at: Optional[float],
+    legacy_token_id: Optional[str],
+) -> tuple[list, list]:
+    root = family or token_id
+    keys = [
+        f"{REFRESH_TOKEN_PREFIX}{user_id}",
+        f"{REFRESH_TOKEN_ROTATED_PREFIX}{user_id}",
+        f"{LEGACY_REFRESH_TOKEN_PREFIX}{user_id}",
+    ]
+    args = [
+        refresh_token_member(token_id, family),
+        refresh_token_member(new_token_id, root),
+        root,
+        _refresh_token_expiry(expires_at),
+        _refresh_token_expiry(new_expires_at),
+        time.time(),
+        REFRESH_TOKEN_MAX_SESSIONS,
+        REFRESH_TOKEN_MAX_ROTATED,
+        legacy_token_id or "",
+    ]
+    return keys, args
+
+def _is_live_refresh_token(score, legacy_member) -> bool:
+    return (score is not None and float(score) > time.time()) or bool(legacy_member)
+
+# sorted set에 member 추가 후 가장 먼저 만료되는 항목부터 max_members 초과분 제거
+# 키는 마지막 항목이 만료될 때 함께 만료됨
+_STORE_MEMBER_LUA = """
+local function store_member(key, member, expires_at, max_members)
+    redis.call("ZADD", key, expires_at, member)
+    local excess = redis.call("ZCARD", key) - max_members
+    if excess > 0 then
+        redis.call("ZREMRANGEBYRANK", key, 0, excess - 1)
+    end
+    local last = redis.call("ZRANGE", key, -1, -1, "WITHSCORES")
+    redis.call("EXPIREAT", key, math.ceil(tonumber(last[2])))
+end
+"""
+
+# KEYS[1]: refresh-tokens:<user_id>
+# ARGV: member, 만료 시각, 현재 시각, 최대 세션 수
+STORE_REFRESH_TOKEN_SCRIPT = _STORE_MEMBER_LUA + """
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", ARGV[3])
+store_member(KEYS[1], ARGV[1], ARGV[2], tonumber(ARGV[4]))
+return 1
+"""
+
+# refresh token 회전 결과
+REFRESH_ROTATED = 1
+REFRESH_INVALID = 0
+REFRESH_REUSED = -1
+
+# KEYS[1]: refresh-tokens:<user_id>, KEYS[2]: refresh-rotated:<user_id>, KEYS[3]: refresh:<user_id> (이전 형식)
+# ARGV: 사용된 member, 새 member, family, 사용된 토큰 만료 시각, 새 토큰 만료 시각, 현재 시각, 최대 세션 수, 최대 회전 기록 수,
+#       이전 형식 member (jti 도입 전 토큰 전체, 없으면 빈 문자열)
+# 사용된 토큰이 유효하면 회전 기록으로 옮기고 새 토큰을 저장
+# 이미 회전된 토큰이면 family의 모든 세션을 제거 (재사용 = 탈취 가능성)
+ROTATE_REFRESH_TOKEN_SCRIPT = _STORE_MEMBER_LUA + """
+local now = ARGV[6]
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now)
+
+if redis.call("ZREM", KEYS[1], ARGV[1]) == 0
+    and redis.call("SREM", KEYS[3], ARGV[1]) == 0
+    and (ARGV[9] == "" or redis.call("SREM", KEYS[3], ARGV[9]) == 0) then
+    if not redis.call("ZSCORE", KEYS[2], ARGV[1]) then
+        return 0
+    end
+
+    local family = ARGV[3]
+    local prefix = family .. ":"
+    for _, member in ipairs(redis.call("ZRANGE", KEYS[1], 0, -1)) do
+        if member == family or string.sub(member, 1, #prefix) == prefix then
+            redis.call("ZREM", KEYS[1], member)
+        end
+    end
+    return -1
+end
+
+store_member(KEYS[2], ARGV[1], ARGV[4], tonumber(ARGV[8]))
+store_member(KEYS[1], ARGV[2], ARGV[5], tonumber(ARGV[7]))
+return 1
+"""
+
+_store_refresh_token_script = redis_client.register_script(STORE_REFRESH_TOKEN_SCRIPT)
+_rotate_refresh_token_script = redis_client.register_script(ROTATE_REFRESH_TOKEN_SCRIPT)
+_async_scripts: dict[str, object] = {}
+
+# 비동기 클라이언트는 startup에서 생성되므로 클라이언트가 바뀌면 다시 등록
+def _async_script(source: str):
+    client = get_async_redis()
+    script = _async_scripts.get(source)
+    if script is None or script.registered_client is not client:
+        script = _async_scripts[source] = client.register_script(source)
+    return script
+
+# Redis 장애 처리
+# 연결/타임아웃 오류는 breaker에 기록하고, breaker가 열려 있으면 Redis를 호출하지 않음
+# 그 외 예외(ResponseError, 취소 등)는 그대로 전파하되 half-open 시험 호출 자리는 반환
+# fail-open 모드에서 로컬 스냅샷이 충분히 최근이면 fallback 결과를 사용하고 그 외에는 503
+REDIS_FAILURES = (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)
+
+def _degraded(fallback, args, kwargs):
+    if (
+        fallback is not None
+        and redis_config.REDIS_DEGRADED_MODE == "fail-open"
+        and revocation_filter.snapshot_age() <= redis_config.REDIS_DEGRADED_SNAPSHOT_MAX_AGE
+    ):
+        return fallback(*args, **kwargs)
+
+    raise HTTPException(
+        status_code=503,
+        detail="인증 저장소를 일시적으로 사용할 수 없습니다.",
+        headers={"Retry-After": str(int(redis_config.REDIS_BREAKER_RESET_SECONDS))}
+    )
+
+def redis_guarded(fallback=None):
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(cls, *args, **kwargs):
+                if not redis_breaker.allow():
+                    return _degraded(fallback, args, kwargs)
+                try:
+                    result = await func(cls, *args, **kwargs)
+                except REDIS_FAILURES:
+                    redis_breaker.record_failure()
+                    return _degraded(fallback, args, kwargs)
+                except BaseException:
+                    redis_breaker.release()
+                    raise
+                redis_breaker.record_success()
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(cls, *args, **kwargs):
+            if not redis_breaker.allow():
+                return _degraded(fallback, args, kwargs)
+            try:
+                result = func(cls, *args, **kwargs)
+            except REDIS_FAILURES:
+                redis_breaker.record_failure()
+                return _degraded(fallback, args, kwargs)
+            except BaseException:
+                redis_breaker.release()
+                raise
+            redis_breaker.record_success()
+            return result
+        return wrapper
+    return decorator
+
+# 블랙리스트 키 (jti 도입 전 토큰은 토큰 전체 키도 함께 확인)
+def _blacklist_keys(token_id: str, legacy_token_id: Optional[str] = None) -> list[str]:
+    keys = [f"{TOKEN_BLACKLIST_PREFIX}{token_id}"]
+    if legacy_token_id:
+        keys.append(f"{TOKEN_BLACKLIST_PREFIX}{legacy_token_id}")
+    return keys
+
+def _might_be_blacklisted(token_id: str, legacy_token_id: Optional[str] = None) -> bool:
+    return revocation_filter.might_contain(token_id) or bool(legacy_token_id and revocation_filter.might_contain(legacy_token_id))
+
+# fail-open fallback: 로컬 filter에 있으면 폐기된 것으로 간주 (false positive는 재로그인으로 해소)
+def _blacklist_snapshot(token_id: str, legacy_token_id: Optional[str] = None) -> bool:
+    return revocation_filter.snapshot_contains(token_id) or bool(legacy_token_id and revocation_filter.snapshot_contains(legacy_token_id))
+
+def _epoch_snapshot(user_id: int) -> float:
+    return user_epoch_cache.get_stale(user_id) or 0.0
+
+def _revoked_snapshot(tokens: list[tuple[str, dict, Optional[str]]]) -> list[bool]:
+    return [
+        _blacklist_snapshot(token_id, legacy_token_id) or _is_issued_before(payload, _epoch_snapshot(payload.get("user_id")))
+        for token_id, payload, legacy_token_id in tokens
+    ]
+
+# 블랙리스트와 refresh 저장소는 전체 JWT 대신 jti(또는 이전 토큰의 digest)를 키로 사용
+# filter에 걸린 토큰만 Redis에서 실제 블랙리스트 여부를 확인
+revocation_filter = RevocationFilter(TOKEN_BLACKLIST_PREFIX, TOKEN_BLACKLIST_CHANNEL)
 
 class TokenService:
     @classmethod
-    def blacklist_token(cls, token:str, expires_in: int=DEFAULT_TOKEN_EXPIRY):
-        key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
-        redis_client.set(key, "1", ex=expires_in)
+    @redis_guarded()
+    def blacklist_token(cls, token_id:str, expires_in: int=DEFAULT_TOKEN_EXPIRY):
+        key = f"{TOKEN_BLACKLIST_PREFIX}{token_id}"
+
+        with redis_client.pipeline() as pipe:
+            pipe.set(key, "1", ex=expires_in)
+            pipe.publish(TOKEN_BLACKLIST_CHANNEL, token_id)
+            pipe.execute()
+        revocation_filter.add(token_id)
 
         return True
     
     @classmethod
-    def is_token_blacklisted(cls, token:str) -> bool:
-        key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
-        return redis_client.exists(key) == 1
-    
+    def is_token_blacklisted(cls, token_id:str, legacy_token_id:Optional[str] = None) -> bool:
+        if not _might_be_blacklisted(token_id, legacy_token_id):
+            return False
+        return cls._is_blacklisted_in_redis(token_id, legacy_token_id)
+
     @classmethod
-    def store_refresh_token(cls, user_id:int, refresh_token:str):
-        user_key = f"{REFRESH_TOKEN_PREFIX}{user_id}"
+    @redis_guarded(fallback=_blacklist_snapshot)
+    def _is_blacklisted_in_redis(cls, token_id:str, legacy_token_id:Optional[str] = None) -> bool:
+        return redis_client.exists(*_blacklist_keys(token_id, legacy_token_id)) > 0
 
-        with redis_client.pipeline() as pipe:
-            pipe.sadd(user_key, refresh_token)
-            expire_seconds = int(timedelta(days=REFRESH_TOKEN_PREFIX + 1).total_seconds())
-            pipe.expire(user_key, expire_seconds)
-            pipe.execute()
+    # 전체 로그아웃
+    # 사용자 epoch을 갱신해 그 이전에 발급된 모든 access token을 O(1)로 무효화
+    @classmethod
+    @redis_guarded()
+    def revoke_user_tokens(cls, user_id:int) -> float:
+        epoch = _new_user_epoch()
+        redis_client.set(f"{USER_EPOCH_PREFIX}{user_id}", epoch, ex=USER_EPOCH_EXPIRY)
+        user_epoch_cache.set(user_id, epoch)
+
+        return epoch
+
+    @classmethod
+    def get_user_epoch(cls, user_id:int) -> float:
+        epoch = user_epoch_cache.get(user_id)
+        if epoch is None:
+            epoch = cls._load_user_epoch(user_id)
+        return epoch
+
+    @classmethod
+    @redis_guarded(fallback=_epoch_snapshot)
+    def _load_user_epoch(cls, user_id:int) -> float:
+        value = redis_client.get(f"{USER_EPOCH_PREFIX}{user_id}")
+        epoch = float(value) if value else 0.0
+        user_epoch_cache.set(user_id, epoch)
+        return epoch
+
+    @classmethod
+    def is_token_revoked_for_user(cls, payload: dict) -> bool:
+        return _is_issued_before(payload, cls.get_user_epoch(payload.get("user_id")))
+    
+    @classmethod
+    @redis_guarded()
+    def store_refresh_token(cls, user_id:int, refresh_token_id:str, expires_at: Optional[float] = None):
+        _store_refresh_token_script(
+            keys=[f"{REFRESH_TOKEN_PREFIX}{user_id}"],
+            args=[refresh_token_id, _refresh_token_expiry(expires_at), time.time(), REFRESH_TOKEN_MAX_SESSIONS],
+        )
         return True
     
     @classmethod
-    def validate_refresh_token(cls, user_id:int, refresh_token:str) -> bool:
-        user_key = f"{REFRESH_TOKEN_PREFIX}{user_id}"
-        return redis_client.sismember(user_key, refresh_token)
+    @redis_guarded()
+    def validate_refresh_token(cls, user_id:int, refresh_token_id:str) -> bool:
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zscore(f"{REFRESH_TOKEN_PREFIX}{user_id}", refresh_token_id)
+            pipe.sismember(f"{LEGACY_REFRESH_TOKEN_PREFIX}{user_id}", refresh_token_id)
+            score, legacy_member = pipe.execute()
+        return _is_live_refresh_token(score, legacy_member)
+    
+    # 반환값: REFRESH_ROTATED / REFRESH_INVALID / REFRESH_REUSED
+    @classmethod
+    @redis_guarded()
+    def rotate_refresh_token(
+        cls,
+        user_id:int,
+        refresh_token_id:str,
+        family:Optional[str],
+        new_refresh_token_id:str,
+        expires_at:Optional[float] = None,
+        new_expires_at:Optional[float] = None,
+        legacy_refresh_token_id:Optional[str] = None,
+    ) -> int:
+        keys, args = _rotate_refresh_token_args(
+            user_id, refresh_token_id, family, new_refresh_token_id, expires_at, new_expires_at, legacy_refresh_token_id
+        )
+        return int(_rotate_refresh_token_script(keys=keys, args=args))
     
     @classmethod
-    def remove_refresh_token(cls, user_id:int, refresh_token:str = None):
+    @redis_guarded()
+    def remove_refresh_token(cls, user_id:int, refresh_token_id:str = None):
         user_key = f"{REFRESH_TOKEN_PREFIX}{user_id}"
+        legacy_key = f"{LEGACY_REFRESH_TOKEN_PREFIX}{user_id}"
         
-        if refresh_token:
-            redis_client.srem(user_key, refresh_token)
-        else:
-            redis_client.delete(user_key)
-        return True
\ No newline at end of file
+        with redis_client.pipeline(transaction=False) as pipe:
+            if refresh_token_id:
+                pipe.zrem(user_key, refresh_token_id)
+                pipe.srem(legacy_key, refresh_token_id)
+            else:
+                pipe.delete(user_key, legacy_key, f"{REFRESH_TOKEN_ROTATED_PREFIX}{user_id}")
+            pipe.execute()
+        return True
+
+
+# redis.asyncio 기반 TokenService
+# 이벤트 루프에서 직접 실행되므로 요청마다 스레드풀을 점유하지 않음
+class AsyncTokenService:
+    @classmethod
+    @redis_guarded()
+    async def blacklist_token(cls, token_id:str, expires_in: int=DEFAULT_TOKEN_EXPIRY):
+        key = f"{TOKEN_BLACKLIST_PREFIX}{token_id}"
+
+        async with get_async_redis().pipeline() as pipe:
+            pipe.set(key, "1", ex=expires_in)
+            pipe.publish(TOKEN_BLACKLIST_CHANNEL, token_id)
+            await pipe.execute()
+        revocation_filter.add(token_id)
+
+        return True
+
+    @classmethod
+    async def is_token_blacklisted(cls, token_id:str, legacy_token_id:Optional[str] = None) -> bool:
+        if not _might_be_blacklisted(token_id, legacy_token_id):
+            return False
+        return await cls._is_blacklisted_in_redis(token_id, legacy_token_id)
+
+    @classmethod
+    @redis_guarded(fallback=_blacklist_snapshot)
+    async def _is_blacklisted_in_redis(cls, token_id:str, legacy_token_id:Optional[str] = None) -> bool:
+        return await get_async_redis().exists(*_blacklist_keys(token_id, legacy_token_id)) > 0
+
+    @classmethod
+    @redis_guarded()
+    async def revoke_user_tokens(cls, user_id:int) -> float:
+        epoch = _new_user_epoch()
+        await get_async_redis().set(f"{USER_EPOCH_PREFIX}{user_id}", epoch, ex=USER_EPOCH_EXPIRY)
+        user_epoch_cache.set(user_id, epoch)
+
+        return epoch
+
+    @classmethod
+    async def get_user_epoch(cls, user_id:int) -> float:
+        epoch = user_epoch_cache.get(user_id)
+        if epoch is None:
+            epoch = await cls._load_user_epoch(user_id)
+        return epoch
+
+    @classmethod
+    @redis_guarded(fallback=_epoch_snapshot)
+    async def _load_user_epoch(cls, user_id:int) -> float:
+        value = await get_async_redis().get(f"{USER_EPOCH_PREFIX}{user_id}")
+        epoch = float(value) if value else 0.0
+        user_epoch_cache.set(user_id, epoch)
+        return epoch
+
+    @classmethod
+    async def is_token_revoked_for_user(cls, payload: dict) -> bool:
+        return _is_issued_before(payload, await cls.get_user_epoch(payload.get("user_id")))
+
+    # 여러 토큰의 폐기 여부(블랙리스트 + 사용자 epoch)를 한 번의 MGET으로 확인
+    # filter에 없는 토큰과 epoch이 캐시된 사용자는 조회 대상에서 제외
+    # tokens: (token id, payload, 이전 형식 id) 목록, 같은 순서로 폐기 여부 반환
+    @classmethod
+    @redis_guarded(fallback=_revoked_snapshot)
+    async def are_tokens_revoked(cls, tokens: list[tuple[str, dict, Optional[str]]]) -> list[bool]:
+        keys: list[str] = []
+        key_index: dict[str, int] = {}
+
+        def lookup(key: str):
+            if key not in key_index:
+                key_index[key] = len(keys)
+                keys.append(key)
+
+        epochs: dict[int, Optional[float]] = {}
+        for token_id, payload, legacy_token_id in tokens:
+            if _might_be_blacklisted(token_id, legacy_token_id):
+                for key in _blacklist_keys(token_id, legacy_token_id):
+                    lookup(key)
+
+            user_id = payload.get("user_id")
+            if user_id not in epochs:
+                epochs[user_id] = user_epoch_cache.get(user_id)
+                if epochs[user_id] is None:
+                    lookup(f"{USER_EPOCH_PREFIX}{user_id}")
+
+        values = await cls._fetch_revocation_values(keys) if keys else []
+
+        for user_id, epoch in epochs.items():
+            if epoch is None:
+                value = values[key_index[f"{USER_EPOCH_PREFIX}{user_id}"]]
+                epochs[user_id] = float(value) if value else 0.0
+                user_epoch_cache.set(user_id, epochs[user_id])
+
+        revoked = []
+        for token_id, payload, legacy_token_id in tokens:
+            blacklisted = any(
+                key in key_index and values[key_index[key]] is not None
+                for key in _blacklist_keys(token_id, legacy_token_id)
+            )
+            revoked.append(blacklisted or _is_issued_before(payload, epochs[payload.get("user_id")]))
+        return revoked
+
+    @classmethod
+    async def _fetch_revocation_values(cls, keys: list[str]) -> list:
+        return await get_async_redis().mget(keys)
+
+    @classmethod
+    @redis_guarded()
+    async def store_refresh_token(cls, user_id:int, refresh_token_id:str, expires_at: Optional[float] = None):
+        await _async_script(STORE_REFRESH_TOKEN_SCRIPT)(
+            keys=[f"{REFRESH_TOKEN_PREFIX}{user_id}"],
+            args=[refresh_token_id, _refresh_token_expiry(expires_at), time.time(), REFRESH_TOKEN_MAX_SESSIONS],
+        )
+        return True
+
+    @classmethod
+    @redis_guarded()
+    async def validate_refresh_token(cls, user_id:int, refresh_token_id:str) -> bool:
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            pipe.zscore(f"{REFRESH_TOKEN_PREFIX}{user_id}", refresh_token_id)
+            pipe.sismember(f"{LEGACY_REFRESH_TOKEN_PREFIX}{user_id}", refresh_token_id)
+            score, legacy_member = await pipe.execute()
+        return _is_live_refresh_token(score, legacy_member)
+
+    @classmethod
+    @redis_guarded()
+    async def rotate_refresh_token(
+        cls,
+        user_id:int,
+        refresh_token_id:str,
+        family:Optional[str],
+        new_refresh_token_id:str,
+        expires_at:Optional[float] = None,
+        new_expires_at:Optional[float] = None,
+        legacy_refresh_token_id:Optional[str] = None,
+    ) -> int:
+        keys, args = _rotate_refresh_token_args(
+            user_id, refresh_token_id, family, new_refresh_token_id, expires_at, new_expires_at, legacy_refresh_token_id
+        )
+        return int(await _async_script(ROTATE_REFRESH_TOKEN_SCRIPT)(keys=keys, args=args))
+
+    @classmethod
+    @redis_guarded()
+    async def remove_refresh_token(cls, user_id:int, refresh_token_id:str = None):
+        user_key = f"{REFRESH_TOKEN_PREFIX}{user_id}"
+        legacy_key = f"{LEGACY_REFRESH_TOKEN_PREFIX}{user_id}"
+
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            if refresh_token_id:
+                pipe.zrem(user_key, refresh_token_id)
+                pipe.srem(legacy_key, refresh_token_id)
+            else:
+                pipe.delete(user_key, legacy_key, f"{REFRESH_TOKEN_ROTATED_PREFIX}{user_id}")
+            await pipe.execute()
+        return True
+
+    # 모든 사용자 키에서 만료된 refresh token 항목 제거
+    @classmethod
+    async def sweep_refresh_tokens(cls) -> int:
+        client = get_async_redis()
+        removed = 0
+        batch = []
+
+        async def flush():
+            nonlocal removed
+            now = time.time()
+            async with client.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.zremrangebyscore(key, "-inf", now)
+                removed += sum(await pipe.execute())
+            batch.clear()
+
+        async for key in client.scan_iter(match=f"{REFRESH_TOKEN_PREFIX}*", count=REFRESH_TOKEN_SWEEP_BATCH, _type="zset"):
+            batch.append(key)
+            if len(batch) >= REFRESH_TOKEN_SWEEP_BATCH:
+                await flush()
+        if batch:
+            await flush()
+        return removed
+
+
+
+# 로그인하지 않는 사용자의 만료 항목 정리
+# 여러 워커 중 lock을 얻은 하나만 주기마다 실행
+async def _sweep_refresh_tokens_periodically():
+    while True:
+        await asyncio.sleep(REFRESH_TOKEN_SWEEP_SECONDS)
+        try:
+            if await get_async_redis().set(REFRESH_TOKEN_SWEEP_LOCK, "1", nx=True, ex=REFRESH_TOKEN_SWEEP_SECONDS - 1):
+                await AsyncTokenService.sweep_refresh_tokens()
+        except (redis.exceptions.RedisError, RuntimeError):
+            pass
+
+def init_refresh_token_sweeper(app: FastAPI):
+    task: asyncio.Task | None = None
+
+    @app.on_event("startup")
+    async def startup_refresh_token_sweeper():
+        nonlocal task
+        task = asyncio.create_task(_sweep_refresh_tokens_periodically())
+
+    @app.on_event("shutdown")
+    async def shutdown_refresh_token_sweeper():
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+# Redis 구성요소 시간/호출 수 계측
+# filter/epoch 캐시에서 바로 반환하는 경로는 제외하고 실제 Redis 명령을 보내는 메서드만 계측
+_LOCAL_FIRST_METHODS = ("is_token_blacklisted", "get_user_epoch", "is_token_revoked_for_user", "are_tokens_revoked")
+_REDIS_LOOKUP_METHODS = ("_is_blacklisted_in_redis", "_load_user_epoch", "_fetch_revocation_values")
+instrument_methods(TokenService, "redis", exclude=_LOCAL_FIRST_METHODS, include=_REDIS_LOOKUP_METHODS)
+instrument_methods(AsyncTokenService, "redis", exclude=_LOCAL_FIRST_METHODS, include=_REDIS_LOOKUP_METHODS)
@@ -3,15 +3,17 @@ from fastapi import Depends
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.utils.security import get_password_hash
-from sqlalchemy.orm import Session
+from app.services.principal_cache import principal_cache
+from app.utils.security import password_hasher
+from sqlalchemy.ext.asyncio import AsyncSession
 
 class UserService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_user(self, user: UserCreate):
-        hashed_password = get_password_hash(user.password)
+    # bcrypt 해시는 프로세스 풀에서 실행
+    async def create_user(self, user: UserCreate):
+        hashed_password = await password_hasher.hash(user.password)
         db_user = User(
             email=user.email, 
             username=user.username, 
@@ -19,25 +21,26 @@ class UserService:
         )
 
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        await principal_cache.invalidate_async(db_user.id)
 
         return db_user
 
 
-    def get_user_by_email(self, email:str):
+    async def get_user_by_email(self, email:str):
         query=(
             select(User).
             where(User.email == email)
         )
-        return self.db.execute(query).scalar_one_or_none()
+        return (await self.db.execute(query)).scalar_one_or_none()
     
-    def get_user_by_username(self, username:str): 
+    async def get_user_by_username(self, username:str): 
         query=(
             select(User).
             where(User.username == username)
         )
-        return self.db.execute(query).scalar_one_or_none()
+        return (await self.db.execute(query)).scalar_one_or_none()
 
-def get_user_service(db: Session=Depends(get_db)):
-    return UserService(db)
\ No newline at end of file
+def get_user_service(db: AsyncSession=Depends(get_db)):
+    return UserService(db)
@@ -1,15 +1,93 @@
 
+import base64
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import hashlib
+import math
+import os
+import secrets
+import threading
 import time
 from typing import Optional
-from jose import jwt, JWTError
 
+from app.core.metrics import instrumented
+from app.utils.jwt_codec import get_codec
+from app.utils.keyring import KeyRing, SigningKey, load_key_ring
 
-SECRET_KEY = "1234567890ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# 운영 환경에서는 반드시 SECRET_KEY 환경 변수로 지정
+SECRET_KEY = os.getenv("SECRET_KEY", "1234567890ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# 서명 키 링 설정
+# kid가 없는 이전 토큰은 SECRET_KEY 기반 HS256 키(LEGACY_KEY_ID)로 검증
+JWT_KEYRING_FILE = os.getenv("JWT_KEYRING_FILE")
+LEGACY_KEY_ID = "legacy-hs256"
+# 키 링 파일로 전환한 뒤 이전 HS256 키를 검증용으로 유지하는 기간 (리프레시 토큰 수명)
+KEY_ROTATION_OVERLAP = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+# JWT 인코딩/디코딩 백엔드 (native | jose | pyjwt)
+JWT_CODEC = os.getenv("JWT_CODEC", "native")
+
+# 검증된 토큰 캐시 설정
+TOKEN_CACHE_MAX_ENTRIES = 10000
+TOKEN_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# jti 길이 (base64url 16자)
+TOKEN_ID_BYTES = 12
+
+def _init_key_ring() -> KeyRing:
+    # 키 링 파일이 없으면 기존 HS256 키로 계속 서명/검증
+    if not JWT_KEYRING_FILE:
+        return KeyRing([SigningKey(LEGACY_KEY_ID, ALGORITHM, SECRET_KEY, activate_at=-1)])
+
+    ring = load_key_ring(JWT_KEYRING_FILE)
+    if ring.verification_key(LEGACY_KEY_ID) is None:
+        # kid가 없는 이전 토큰은 키 파일 배포 후 KEY_ROTATION_OVERLAP 동안만 검증하고 서명에는 쓰지 않음
+        # 재시작할 때마다 기간이 연장되지 않도록 파일 수정 시각을 기준으로 함
+        ring.add(SigningKey(
+            LEGACY_KEY_ID, ALGORITHM, SECRET_KEY,
+            activate_at=math.inf,
+            expire_at=os.path.getmtime(JWT_KEYRING_FILE) + KEY_ROTATION_OVERLAP,
+        ))
+    return ring
+
+key_ring = _init_key_ring()
+jwt_codec = get_codec(JWT_CODEC)
+
+def _resolve_key(kid: Optional[str]) -> Optional[SigningKey]:
+    return key_ring.verification_key(kid or LEGACY_KEY_ID)
+
+def _encode(payload: dict) -> str:
+    return jwt_codec.encode(payload, key_ring.signing_key())
+
+def generate_token_id() -> str:
+    return secrets.token_urlsafe(TOKEN_ID_BYTES)
+
+# 토큰 식별자
+# jti가 없는 이전 토큰은 토큰 전체 대신 고정 길이 digest를 사용
+def get_token_id(token: str, payload: Optional[dict] = None) -> str:
+    if payload and payload.get("jti"):
+        return payload["jti"]
+
+    digest = hashlib.sha256(token.encode()).digest()[:16]
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+# jti 도입 전 토큰은 블랙리스트 키와 refresh 저장소에 토큰 전체로 기록되어 있음
+# 전환 기간 동안(이전 토큰이 모두 만료될 때까지) 이 값으로도 함께 확인하며, jti가 있으면 None
+def get_legacy_token_id(token: str, payload: Optional[dict] = None) -> Optional[str]:
+    if payload and payload.get("jti"):
+        return None
+    return token
+
+# 발급 시각 (ms 단위 내림)
+# 사용자 epoch은 올림으로 저장하므로 epoch 이전에 발급된 토큰은 항상 iat < epoch
+def get_issued_at() -> float:
+    return math.floor(time.time() * 1000) / 1000
+
+@instrumented("jwt")
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
 
@@ -20,13 +98,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
     to_encode.update(
         {
-            "exp": expire
+            "exp": expire, 
+            "iat": get_issued_at(), 
+            "jti": data.get("jti") or generate_token_id()
         }
     )
 
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _encode(to_encode)
     return encoded_jwt
 
+@instrumented("jwt")
 def create_refresh_token(data: dict) -> str:
     user_id = data["user_id"]
     expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
@@ -34,22 +115,123 @@ def create_refresh_token(data: dict) -> str:
     refresh_payload = {
         "user_id": user_id, 
         "exp": expire, 
-        "type": "refresh"
+        "iat": get_issued_at(), 
+        "type": "refresh", 
+        "jti": data.get("jti") or generate_token_id()
     }
+    # 회전된 토큰은 최초 로그인 토큰의 id를 family로 유지
+    if data.get("fam"):
+        refresh_payload["fam"] = data["fam"]
 
-    encoded_jwt = jwt.encode(refresh_payload, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _encode(refresh_payload)
     return encoded_jwt
 
+# 헤더의 kid로 검증 키를 바로 찾고 해당 키의 알고리즘만 허용
+@instrumented("jwt")
 def verify_token(token: str) -> dict:
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    return jwt_codec.decode(token, _resolve_key)
+
+
+class TokenCache:
+    """
+    검증에 성공한 토큰 payload의 LRU 캐시
+    토큰 digest를 키로 사용하며 각 항목은 토큰의 exp 시점에 만료됨
+    블랙리스트 확인은 캐시 조회 전에 호출하는 쪽에서 수행해야 함
+    """
+    ENTRY_OVERHEAD = 256
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_MAX_ENTRIES, max_bytes: int = TOKEN_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size_bytes = 0
+        self._entries: OrderedDict[bytes, tuple[dict, float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    @classmethod
+    def _entry_size(cls, payload: dict) -> int:
+        return cls.ENTRY_OVERHEAD + sum(len(str(key)) + len(str(value)) for key, value in payload.items())
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            payload, expires_at, size = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._size_bytes -= size
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def set(self, token: str, payload: dict):
+        exp = payload.get("exp")
+        if exp is None:
+            return
+
+        key = self._key(token)
+        size = self._entry_size(payload)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[2]
+
+            self._entries[key] = (payload, float(exp), size)
+            self._size_bytes += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+    def invalidate(self, token: str):
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size_bytes -= entry[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+            }
+
+
+token_cache = TokenCache()
+
+def verify_token_cached(token: str) -> dict:
+    payload = token_cache.get(token)
+    if payload is not None:
         return payload
-    except JWTError:
-        return None
+
+    payload = verify_token(token)
+    if payload is not None:
+        token_cache.set(token, payload)
+    return payload
     
 def get_token_expiry(token: str) -> int:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = verify_token(token)
         exp = payload.get("exp")
 
         if exp:
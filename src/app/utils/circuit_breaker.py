@@ -0,0 +1,78 @@
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold에 도달하면 open 상태가 되어 호출을 바로 거절함
+    reset_timeout이 지나면 half-open 상태에서 한 번의 시험 호출만 허용하고
+    성공하면 closed, 실패하면 다시 open으로 전환
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 5.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_count = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._probing = False
+
+    # Redis 가용성과 무관한 오류(스크립트 오류, 취소 등)로 끝난 호출
+    # 상태는 그대로 두고 half-open 시험 호출 자리만 반환해 다음 호출이 다시 시험할 수 있게 함
+    def release(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._current_state() == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.opened_count += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "failures": self.failures,
+                "opened_count": self.opened_count,
+                "retry_in": round(max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at)), 3) if state == self.OPEN else 0.0,
+            }
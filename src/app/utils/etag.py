@@ -0,0 +1,19 @@
+import hashlib
+
+
+# 강한 ETag 생성 (응답 본문이 아닌 id/버전 값으로 계산)
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+# If-None-Match는 약한 비교를 사용 (RFC 9110 13.1.2)
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
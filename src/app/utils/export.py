@@ -0,0 +1,41 @@
+import csv
+import io
+import json
+
+POST_EXPORT_COLUMNS = ("id", "title", "author_id", "content", "create_at")
+POST_EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _export_value(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+# 파티션(행 묶음) 하나를 청크 하나로 인코딩
+async def ndjson_chunks(partitions):
+    async for rows in partitions:
+        lines = (
+            json.dumps(dict(zip(POST_EXPORT_COLUMNS, map(_export_value, row))), ensure_ascii=False)
+            for row in rows
+        )
+        yield ("\n".join(lines) + "\n").encode()
+
+async def csv_chunks(partitions):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(POST_EXPORT_COLUMNS)
+
+    async for rows in partitions:
+        writer.writerows([_export_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+EXPORT_ENCODERS = {
+    "ndjson": ndjson_chunks,
+    "csv": csv_chunks,
+}
@@ -0,0 +1,40 @@
+"""
+응답 JSON 빠른 인코딩
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 같은 형식을 만듦
+출력 형식은 Pydantic model_dump_json과 같음 (공백 없음, 비 ASCII 그대로, UTC는 Z)
+"""
+import json
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        if value.utcoffset() == timedelta(0):
+            text = text[:-6] + "Z"
+        return text
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    response_model 검증/직렬화 없이 바로 bytes로 인코딩하는 JSON 응답
+    bytes는 이미 인코딩된 JSON으로 보고 그대로 전송 (캐시된 본문)
+    JSONResponse를 상속하므로 OpenAPI 문서는 response_model 스키마를 그대로 사용함
+    """
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
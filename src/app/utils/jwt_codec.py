@@ -0,0 +1,223 @@
+import base64
+import binascii
+import calendar
+from datetime import datetime
+import hashlib
+import hmac
+import json
+import time
+from typing import Callable, Optional
+
+from jose import jwt, JWTError
+
+from app.utils.keyring import SigningKey
+
+
+# kid -> 검증 키 조회 함수
+KeyResolver = Callable[[Optional[str]], Optional[SigningKey]]
+
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+def _to_timestamp(value):
+    if isinstance(value, datetime):
+        return calendar.timegm(value.utctimetuple())
+    return value
+
+
+class JWTCodec:
+    """
+    JWT 인코딩/디코딩 백엔드 인터페이스
+    decode는 서명/클레임 검증 실패 시 None을 반환함
+    """
+    name = ""
+
+    def encode(self, payload: dict, key: SigningKey) -> str:
+        raise NotImplementedError
+
+    def decode(self, token: str, resolve_key: KeyResolver) -> Optional[dict]:
+        raise NotImplementedError
+
+
+class JoseCodec(JWTCodec):
+    name = "jose"
+
+    def encode(self, payload: dict, key: SigningKey) -> str:
+        return jwt.encode(payload, key.signer, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str, resolve_key: KeyResolver) -> Optional[dict]:
+        try:
+            header = jwt.get_unverified_header(token)
+            key = resolve_key(header.get("kid"))
+            if key is None:
+                return None
+            return jwt.decode(token, key.verifier, algorithms=[key.algorithm])
+        except JWTError:
+            return None
+
+
+class PyJWTCodec(JWTCodec):
+    """
+    PyJWT 어댑터 (PyJWT 설치 시에만 사용 가능)
+    키 별로 PyJWT가 받는 형식(비밀키 bytes 또는 PEM)을 한 번만 만들어 둠
+    """
+    name = "pyjwt"
+
+    def __init__(self):
+        import jwt as pyjwt
+
+        self._pyjwt = pyjwt
+        self._signers: dict[str, bytes] = {}
+        self._verifiers: dict[str, bytes] = {}
+
+    def _signer(self, key: SigningKey) -> bytes:
+        prepared = self._signers.get(key.kid)
+        if prepared is None:
+            prepared = key.secret if key.is_symmetric else key.signer.to_pem()
+            self._signers[key.kid] = prepared
+        return prepared
+
+    def _verifier(self, key: SigningKey) -> bytes:
+        prepared = self._verifiers.get(key.kid)
+        if prepared is None:
+            prepared = key.secret if key.is_symmetric else key.verifier.to_pem()
+            self._verifiers[key.kid] = prepared
+        return prepared
+
+    def encode(self, payload: dict, key: SigningKey) -> str:
+        return self._pyjwt.encode(payload, self._signer(key), algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str, resolve_key: KeyResolver) -> Optional[dict]:
+        try:
+            header = self._pyjwt.get_unverified_header(token)
+            key = resolve_key(header.get("kid"))
+            if key is None:
+                return None
+            return self._pyjwt.decode(token, self._verifier(key), algorithms=[key.algorithm])
+        except self._pyjwt.PyJWTError:
+            return None
+
+
+class NativeHS256Codec(JWTCodec):
+    """
+    HS256 전용 경량 구현
+    키 별 HMAC 객체와 인코딩된 헤더를 미리 만들어 두고 copy()로 재사용함
+    HS256 이외의 키는 fallback 코덱(jose)으로 처리
+    """
+    name = "native"
+    ALGORITHM = "HS256"
+
+    def __init__(self, fallback: Optional[JWTCodec] = None):
+        self.fallback = fallback or JoseCodec()
+        self._hmacs: dict[str, "hmac.HMAC"] = {}
+        self._headers: dict[str, bytes] = {}
+
+    def _hmac(self, key: SigningKey):
+        prepared = self._hmacs.get(key.kid)
+        if prepared is None:
+            prepared = hmac.new(key.secret, digestmod=hashlib.sha256)
+            self._hmacs[key.kid] = prepared
+        return prepared.copy()
+
+    def _header(self, key: SigningKey) -> bytes:
+        header = self._headers.get(key.kid)
+        if header is None:
+            # jose와 같은 헤더 직렬화 (정렬된 키, 공백 없음)
+            header = _b64url_encode(
+                json.dumps({"alg": self.ALGORITHM, "kid": key.kid, "typ": "JWT"}, separators=(",", ":"), sort_keys=True).encode()
+            )
+            self._headers[key.kid] = header
+        return header
+
+    def encode(self, payload: dict, key: SigningKey) -> str:
+        if key.algorithm != self.ALGORITHM:
+            return self.fallback.encode(payload, key)
+
+        claims = dict(payload)
+        for claim in _TIME_CLAIMS:
+            if claim in claims:
+                claims[claim] = _to_timestamp(claims[claim])
+
+        signing_input = self._header(key) + b"." + _b64url_encode(json.dumps(claims, separators=(",", ":")).encode())
+        mac = self._hmac(key)
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64url_encode(mac.digest())).decode()
+
+    def decode(self, token: str, resolve_key: KeyResolver) -> Optional[dict]:
+        try:
+            raw = token.encode("ascii")
+            signing_input, _, signature = raw.rpartition(b".")
+            header_segment, _, payload_segment = signing_input.partition(b".")
+            if not header_segment or not payload_segment or b"." in payload_segment:
+                return None
+
+            header = json.loads(_b64url_decode(header_segment))
+            if not isinstance(header, dict):
+                return None
+
+            key = resolve_key(header.get("kid"))
+            if key is None:
+                return None
+            if key.algorithm != self.ALGORITHM:
+                return self.fallback.decode(token, resolve_key)
+            if header.get("alg") != self.ALGORITHM:
+                return None
+
+            mac = self._hmac(key)
+            mac.update(signing_input)
+            # 인코딩된 서명끼리 비교해 패딩/비정규 base64 변형도 거부
+            if not hmac.compare_digest(_b64url_encode(mac.digest()), signature):
+                return None
+
+            payload = json.loads(_b64url_decode(payload_segment))
+        except (UnicodeError, ValueError, binascii.Error):
+            return None
+
+        if not isinstance(payload, dict) or not self._validate_claims(payload):
+            return None
+        return payload
+
+    # jose의 기본 클레임 검증과 동일한 규칙 (leeway 0, audience 미지정)
+    @staticmethod
+    def _validate_claims(payload: dict) -> bool:
+        now = int(time.time())
+
+        for claim in _TIME_CLAIMS:
+            value = payload.get(claim)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                return False
+
+        exp = payload.get("exp")
+        if exp is not None and exp < now:
+            return False
+
+        nbf = payload.get("nbf")
+        if nbf is not None and nbf > now:
+            return False
+
+        # audience를 지정하지 않았으므로 aud가 있는 토큰은 거부
+        if "aud" in payload:
+            return False
+
+        for claim in ("sub", "jti"):
+            if claim in payload and not isinstance(payload[claim], str):
+                return False
+        return True
+
+
+JWT_CODECS = {
+    NativeHS256Codec.name: NativeHS256Codec,
+    JoseCodec.name: JoseCodec,
+    PyJWTCodec.name: PyJWTCodec,
+}
+
+def get_codec(name: str) -> JWTCodec:
+    if name not in JWT_CODECS:
+        raise ValueError(f"Unknown JWT codec: {name}")
+    return JWT_CODECS[name]()
@@ -0,0 +1,196 @@
+import base64
+import json
+import threading
+import time
+from typing import Optional
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from jose import jwk
+from jose.backends.base import Key
+
+SYMMETRIC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+ASYMMETRIC_ALGORITHMS = {"RS256", "ES256", "EdDSA"}
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class Ed25519Key(Key):
+    """
+    python-jose에 없는 EdDSA(Ed25519) 키 구현
+    jwk.register_key로 등록해 jose의 sign/verify 경로에서 그대로 사용
+    """
+    def __init__(self, key, algorithm):
+        self._algorithm = algorithm
+
+        if isinstance(key, (Ed25519PrivateKey, Ed25519PublicKey)):
+            self._key = key
+        elif isinstance(key, dict):
+            if "d" in key:
+                self._key = Ed25519PrivateKey.from_private_bytes(_b64url_decode(key["d"]))
+            else:
+                self._key = Ed25519PublicKey.from_public_bytes(_b64url_decode(key["x"]))
+        else:
+            pem = key.encode() if isinstance(key, str) else key
+            try:
+                self._key = serialization.load_pem_private_key(pem, password=None)
+            except ValueError:
+                self._key = serialization.load_pem_public_key(pem)
+
+        if not isinstance(self._key, (Ed25519PrivateKey, Ed25519PublicKey)):
+            raise ValueError("EdDSA key must be an Ed25519 key")
+
+    def sign(self, msg: bytes) -> bytes:
+        return self._key.sign(msg)
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        public_key = self._key.public_key() if isinstance(self._key, Ed25519PrivateKey) else self._key
+        try:
+            public_key.verify(sig, msg)
+            return True
+        except InvalidSignature:
+            return False
+
+    def is_public(self) -> bool:
+        return isinstance(self._key, Ed25519PublicKey)
+
+    def public_key(self):
+        if isinstance(self._key, Ed25519PublicKey):
+            return self
+        return Ed25519Key(self._key.public_key(), self._algorithm)
+
+    def to_pem(self) -> bytes:
+        if isinstance(self._key, Ed25519PrivateKey):
+            return self._key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        return self._key.public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+
+    def to_dict(self) -> dict:
+        public_key = self.public_key()._key
+        raw = public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        return {"kty": "OKP", "crv": "Ed25519", "alg": self._algorithm, "x": _b64url(raw)}
+
+
+jwk.register_key("EdDSA", Ed25519Key)
+
+
+class SigningKey:
+    """
+    키 링의 키 하나
+    서명/검증용 jose 키 객체는 생성 시 한 번만 만들어 재사용함
+    activate_at 이후 서명에 사용되고 expire_at까지 검증에 사용됨
+    """
+    def __init__(
+        self,
+        kid: str,
+        algorithm: str,
+        key,
+        activate_at: float = 0,
+        expire_at: Optional[float] = None,
+    ):
+        if algorithm not in SYMMETRIC_ALGORITHMS | ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+        self.kid = kid
+        self.algorithm = algorithm
+        self.activate_at = activate_at
+        self.expire_at = expire_at
+
+        constructed = jwk.construct(key, algorithm)
+        if algorithm in SYMMETRIC_ALGORITHMS:
+            self.secret = key.encode() if isinstance(key, str) else key
+            self.signer = constructed
+            self.verifier = constructed
+        else:
+            self.secret = None
+            # 공개키만 주어진 경우 검증 전용 키
+            self.signer = None if constructed.is_public() else constructed
+            self.verifier = constructed.public_key()
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.algorithm in SYMMETRIC_ALGORITHMS
+
+    def can_sign(self, now: float) -> bool:
+        return self.signer is not None and self.activate_at <= now and self.can_verify(now)
+
+    def can_verify(self, now: float) -> bool:
+        return self.expire_at is None or now < self.expire_at
+
+    def public_jwk(self) -> Optional[dict]:
+        # 대칭키는 절대 공개하지 않음
+        if self.is_symmetric:
+            return None
+        return {**self.verifier.to_dict(), "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+class KeyRing:
+    """
+    kid로 색인된 서명 키 모음
+    가장 최근에 활성화된 키로 서명하고, 만료 전의 모든 키로 검증함
+    키 교체는 키 파일에 새 키의 activate_at과 이전 키의 expire_at을 지정해 이미 발급된 토큰이 유효하도록 함
+    """
+    def __init__(self, keys: list[SigningKey] = ()):
+        self._keys: dict[str, SigningKey] = {}
+        self._lock = threading.Lock()
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: SigningKey):
+        with self._lock:
+            self._keys[key.kid] = key
+
+    def remove(self, kid: str):
+        with self._lock:
+            self._keys.pop(kid, None)
+
+    def signing_key(self) -> SigningKey:
+        now = time.time()
+        candidates = [key for key in self._keys.values() if key.can_sign(now)]
+        if not candidates:
+            raise RuntimeError("No active signing key")
+        return max(candidates, key=lambda key: key.activate_at)
+
+    def verification_key(self, kid: str) -> Optional[SigningKey]:
+        key = self._keys.get(kid)
+        if key is None or not key.can_verify(time.time()):
+            return None
+        return key
+
+    # 아직 활성화 전인 키도 포함해 게이트웨이가 미리 받아둘 수 있게 함
+    def jwks(self) -> dict:
+        now = time.time()
+        return {
+            "keys": [
+                public_jwk
+                for key in self._keys.values()
+                if key.can_verify(now) and (public_jwk := key.public_jwk()) is not None
+            ]
+        }
+
+
+# 키 파일 형식
+# {"keys": [{"kid": "...", "alg": "ES256", "key": "<PEM 또는 HS 비밀키>", "activate_at": 0, "expire_at": null}]}
+def load_key_ring(path: str) -> KeyRing:
+    with open(path) as f:
+        config = json.load(f)
+
+    return KeyRing([
+        SigningKey(
+            kid=item["kid"],
+            algorithm=item["alg"],
+            key=item["key"],
+            activate_at=item.get("activate_at", 0),
+            expire_at=item.get("expire_at"),
+        )
+        for item in config["keys"]
+    ])
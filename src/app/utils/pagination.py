@@ -0,0 +1,31 @@
+import base64
+import json
+from typing import Optional
+
+POSTS_PAGE_DEFAULT_LIMIT = 20
+POSTS_PAGE_MAX_LIMIT = 100
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+# 키셋 페이지네이션 커서
+# 클라이언트에는 의미 없는 문자열로 보이도록 JSON을 base64url로 인코딩
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[list]:
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError as e:
+        raise InvalidCursorError(cursor) from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(cursor)
+    return values
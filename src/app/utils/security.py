@@ -1,9 +1,79 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from fastapi import FastAPI, HTTPException
 from passlib.context import CryptContext
 
+from app.core.metrics import instrumented
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 전용 프로세스 풀 설정
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+# 실행 중 + 대기 중인 작업이 이 값을 넘으면 즉시 503 반환
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 8)))
+PASSWORD_HASH_RETRY_AFTER = 1
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 별도 프로세스 풀에서 실행
+    GIL과 요청 스레드풀을 점유하지 않으며, 대기열이 가득 차면 바로 거절함
+    """
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    # pending은 이벤트 루프에서만 변경되므로 별도 잠금이 필요 없음
+    async def _submit(self, func, *args):
+        if self.pending >= self.max_pending:
+            raise HTTPException(
+                status_code=503,
+                detail="요청이 많아 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER)}
+            )
+
+        self.start()
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+
+    @instrumented("password")
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    @instrumented("password")
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+
+password_hasher = PasswordHasher()
+
+def init_password_hasher(app: FastAPI):
+    @app.on_event("startup")
+    async def startup_password_hasher():
+        password_hasher.start()
+
+    @app.on_event("shutdown")
+    async def shutdown_password_hasher():
+        password_hasher.shutdown()
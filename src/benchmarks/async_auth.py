@@ -0,0 +1,72 @@
+"""
+get_current_user (async) vs get_current_user_sync 처리량 비교
+
+로컬 Redis(localhost:6379)가 필요함
+    cd src && python -m benchmarks.async_auth --requests 5000 --concurrency 200
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app.core.redis_config import init_redis
+from app.dependencies.auth import get_current_user, get_current_user_sync
+from app.models.user import User
+from app.schemas.user import UserPrincipal
+from app.utils.auth import create_access_token
+from benchmarks.common import asgi_client, temp_database
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    init_redis(app)
+
+    @app.get("/sync")
+    def sync_route(user: UserPrincipal = Depends(get_current_user_sync)):
+        return {"id": user.id}
+
+    @app.get("/async")
+    async def async_route(user: UserPrincipal = Depends(get_current_user)):
+        return {"id": user.id}
+
+    return app
+
+
+async def run(client: httpx.AsyncClient, path: str, token: str, total: int, concurrency: int) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - start)
+
+
+async def main(total: int, concurrency: int):
+    app = build_app()
+    with temp_database() as SessionLocal:
+        with SessionLocal() as db:
+            user = User(email="bench@example.com", username="bench", password="x")
+            db.add(user)
+            db.commit()
+            token = create_access_token({"username": user.username, "email": user.email, "user_id": user.id})
+
+        async with asgi_client(app) as client:
+            for path in ("/sync", "/async"):
+                await run(client, path, token, min(total, 500), concurrency)
+                rps = await run(client, path, token, total, concurrency)
+                print(f"{path:<7} {rps:10.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
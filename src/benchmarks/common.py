@@ -0,0 +1,168 @@
+"""
+벤치마크 공용 유틸리티
+"""
+import contextlib
+import inspect
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+import redis
+import redis.asyncio
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import database
+from app.core import redis_config
+from app.database import Base, create_async_db_engine, create_db_engine
+from app.models.post import Post  # noqa: F401 (relationship 등록)
+from app.models.user import User  # noqa: F401
+from app.services.post_search import init_post_search
+
+
+# 모듈 전역으로 import된 engine 이름 (main의 init_db, post_search, metrics 등이 직접 참조)
+ENGINE_NAMES = ("engine", "async_engine", "read_engine", "async_read_engine")
+SESSION_FACTORIES = {
+    "SessionLocal": "engine",
+    "ReadSessionLocal": "read_engine",
+    "AsyncSessionLocal": "async_engine",
+    "AsyncReadSessionLocal": "async_read_engine",
+}
+
+
+def _replace_engines(replacements: dict):
+    # app 모듈과 main에서 기존 engine 객체를 참조하는 전역 이름을 모두 교체
+    originals = {name: getattr(database, name) for name in replacements}
+    for module in list(sys.modules.values()):
+        if module is None or not (module.__name__ == "main" or module.__name__.startswith("app.")):
+            continue
+        for name, replacement in replacements.items():
+            if getattr(module, name, None) is originals[name]:
+                setattr(module, name, replacement)
+    for factory, name in SESSION_FACTORIES.items():
+        getattr(database, factory).configure(bind=replacements[name])
+    return originals
+
+
+@contextlib.contextmanager
+def temp_database():
+    # 앱의 engine과 세션을 임시 SQLite 파일로 교체 (DATABASE_MODE 설정을 따름)
+    # startup의 init_db와 open_read_db를 쓰는 응답 스트리밍도 임시 파일을 사용하므로 저장소의 DB는 바뀌지 않음
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        # 앱과 같은 SQLite 프로필(WAL, PRAGMA, query_only 조회 풀) 적용
+        engines = {
+            "engine": create_db_engine(f"sqlite:///{path}"),
+            "async_engine": create_async_db_engine(f"sqlite+aiosqlite:///{path}"),
+            "read_engine": create_db_engine(f"sqlite:///{path}", read_only=True),
+            "async_read_engine": create_async_db_engine(f"sqlite+aiosqlite:///{path}", read_only=True),
+        }
+        Base.metadata.create_all(bind=engines["engine"])
+        with engines["engine"].begin() as conn:
+            init_post_search(conn)
+
+        originals = _replace_engines(engines)
+        try:
+            yield database.SessionLocal
+        finally:
+            _replace_engines(originals)
+            # 비동기 engine은 shutdown의 close_db에서 정리됨
+            engines["engine"].dispose()
+            engines["read_engine"].dispose()
+
+
+@contextlib.contextmanager
+def fake_redis():
+    # 로컬 Redis 대신 fakeredis 사용 (Lua 스크립트 실행에 lupa 필요: pip install "fakeredis[lua]")
+    # 동기 클라이언트는 풀을 교체하고, 비동기 풀은 startup에서 만들어지므로 옵션으로 주입
+    import fakeredis
+    import fakeredis.aioredis
+
+    server = fakeredis.FakeServer()
+    original_pool = redis_config.redis_client.connection_pool
+    original_options = redis_config.REDIS_POOL_OPTIONS
+    redis_config.redis_client.connection_pool = redis.ConnectionPool(
+        connection_class=fakeredis.FakeConnection, server=server, decode_responses=True
+    )
+    # fakeredis 연결은 health check PING에 응답하지 않아 첫 명령이 멈추므로 비활성화
+    redis_config.REDIS_POOL_OPTIONS = {"connection_class": fakeredis.aioredis.FakeConnection, "server": server, "health_check_interval": 0}
+    try:
+        yield server
+    finally:
+        redis_config.redis_client.connection_pool = original_pool
+        redis_config.REDIS_POOL_OPTIONS = original_options
+
+
+class CallCounter:
+    """
+    Redis 왕복 횟수(명령 1회 또는 파이프라인 1회)와 DB 쿼리 수 집계
+    install() 동안 redis 클라이언트 클래스와 SQLAlchemy Engine 이벤트에 훅을 걸어 둠
+    """
+    def __init__(self):
+        self.redis = 0
+        self.db = 0
+        self._patched = []
+
+    def reset(self):
+        self.redis = 0
+        self.db = 0
+
+    def _count_redis(self, owner, name: str):
+        original = getattr(owner, name)
+        counter = self
+
+        if inspect.iscoroutinefunction(original):
+            async def wrapper(*args, **kwargs):
+                counter.redis += 1
+                return await original(*args, **kwargs)
+        else:
+            def wrapper(*args, **kwargs):
+                counter.redis += 1
+                return original(*args, **kwargs)
+
+        setattr(owner, name, wrapper)
+        self._patched.append((owner, name, original))
+
+    def _count_db(self, conn, cursor, statement, parameters, context, executemany):
+        self.db += 1
+
+    @contextlib.contextmanager
+    def install(self):
+        self._count_redis(redis.Redis, "execute_command")
+        self._count_redis(redis.client.Pipeline, "execute")
+        self._count_redis(redis.asyncio.Redis, "execute_command")
+        self._count_redis(redis.asyncio.client.Pipeline, "execute")
+        event.listen(Engine, "before_cursor_execute", self._count_db)
+        try:
+            yield self
+        finally:
+            event.remove(Engine, "before_cursor_execute", self._count_db)
+            for owner, name, original in reversed(self._patched):
+                setattr(owner, name, original)
+            self._patched.clear()
+
+
+@contextlib.asynccontextmanager
+async def asgi_client(app: FastAPI):
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+    finally:
+        await app.router.shutdown()
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def timed(coro) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, result
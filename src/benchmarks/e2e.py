@@ -0,0 +1,233 @@
+"""
+전체 엔드포인트 end-to-end 벤치마크
+/register, /login, /refresh, /posts CRUD, /introspect(50개씩), /logout, /logout-all을 순서대로 실행하고
+엔드포인트별 처리량, p50/p95/p99 지연시간, 요청당 Redis 왕복/DB 쿼리 수를 JSON으로 출력
+
+기본값은 in-process(ASGI) + fakeredis + 임시 SQLite 파일이라 외부 의존성 없이 실행됨
+    cd src && python -m benchmarks.e2e --output bench.json
+    cd src && python -m benchmarks.e2e --redis local          # localhost:6379 사용
+이전 결과와 비교해 p95가 threshold 이상 느려지면 exit 1
+    cd src && python -m benchmarks.e2e --baseline bench.json --threshold 0.2
+uvicorn으로 띄운 서버 대상 (Redis/DB 호출 수는 집계하지 않음)
+    DATABASE_URL=sqlite:///./bench.db ASYNC_DATABASE_URL=sqlite+aiosqlite:///./bench.db uvicorn main:app
+    cd src && python -m benchmarks.e2e --url http://127.0.0.1:8000
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import subprocess
+import time
+
+import httpx
+
+from app import database
+from app.services.rate_limiter import rate_limiter
+from benchmarks.common import CallCounter, asgi_client, fake_redis, percentile, temp_database, timed
+
+
+INTROSPECT_BATCH = 50
+
+
+class Phase:
+    """
+    엔드포인트 하나에 대한 측정 구간
+    요청 생성 함수 목록을 concurrency 개의 worker가 나눠 실행함
+    """
+    def __init__(self, name: str, counter: CallCounter | None):
+        self.name = name
+        self.counter = counter
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.elapsed = 0.0
+        self.redis_calls = 0
+        self.db_queries = 0
+
+    async def run(self, requests: list, concurrency: int) -> list[httpx.Response]:
+        responses: list[httpx.Response | None] = [None] * len(requests)
+        remaining = iter(enumerate(requests))
+
+        async def worker():
+            for index, make_request in remaining:
+                elapsed, response = await timed(make_request())
+                self.latencies.append(elapsed)
+                if response.status_code >= 400:
+                    self.errors += 1
+                responses[index] = response
+
+        if self.counter is not None:
+            self.counter.reset()
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        self.elapsed = time.perf_counter() - start
+        if self.counter is not None:
+            self.redis_calls = self.counter.redis
+            self.db_queries = self.counter.db
+        return responses
+
+    def result(self) -> dict:
+        count = len(self.latencies)
+        counted = self.counter is not None and count > 0
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "throughput_rps": round(count / self.elapsed, 1) if self.elapsed else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 3) if count else None,
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 3) if count else None,
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 3) if count else None,
+            "redis_calls_per_request": round(self.redis_calls / count, 2) if counted else None,
+            "db_queries_per_request": round(self.db_queries / count, 2) if counted else None,
+        }
+
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def scenario(client: httpx.AsyncClient, counter: CallCounter | None, users: int, logins: int, posts: int, concurrency: int) -> dict:
+    phases: dict[str, Phase] = {}
+
+    async def run(name: str, requests: list) -> list[httpx.Response]:
+        phase = phases[name] = Phase(name, counter)
+        return await phase.run(requests, concurrency)
+
+    run_id = time.time_ns()
+    accounts = [
+        {"email": f"bench-{run_id}-{i}@example.com", "username": f"bench-{run_id}-{i}", "password": "benchmark-password"}
+        for i in range(users)
+    ]
+    await run("POST /register", [lambda account=account: client.post("/register", json=account) for account in accounts])
+
+    login_responses = await run("POST /login", [
+        lambda account=accounts[i % users]: client.post("/login", json={"email": account["email"], "password": account["password"]})
+        for i in range(logins)
+    ])
+    # 비밀번호 해시 풀이 포화되면 로그인이 503으로 거절될 수 있으므로 (Phase에서 오류로 집계)
+    # 이후 구간은 성공한 로그인의 토큰만 사용
+    # 사용자별 첫 토큰은 logout-all에, 나머지는 logout에 사용
+    tokens: list[dict] = []
+    user_tokens: dict[int, dict] = {}
+    other_tokens: list[dict] = []
+    for i, response in enumerate(login_responses):
+        if response.status_code != 200:
+            continue
+        token = response.json()
+        tokens.append(token)
+        if i % users in user_tokens:
+            other_tokens.append(token)
+        else:
+            user_tokens[i % users] = token
+    if not tokens:
+        raise SystemExit("all logins failed; lower --concurrency")
+
+    await run("POST /refresh", [
+        lambda token=token: client.post("/refresh", json={"refresh_token": token["refresh_token"]})
+        for token in tokens
+    ])
+
+    # 게시글 구간은 마지막 logout-all 전까지 유효한 첫 번째 토큰 사용
+    headers = bearer(tokens[0]["access_token"])
+    created = await run("POST /posts", [
+        lambda i=i: client.post("/posts", json={"title": f"title {i}", "content": "benchmark content"}, headers=headers)
+        for i in range(posts)
+    ])
+    post_ids = [response.json()["id"] for response in created if response.status_code < 400]
+
+    await run("GET /posts/", [lambda: client.get("/posts/", headers=headers) for _ in range(posts)])
+    await run("GET /posts/{id}", [lambda post_id=post_id: client.get(f"/posts/{post_id}", headers=headers) for post_id in post_ids])
+    await run("PUT /posts/{id}", [
+        lambda post_id=post_id: client.put(f"/posts/{post_id}", json={"title": f"updated {post_id}"}, headers=headers)
+        for post_id in post_ids
+    ])
+    await run("DELETE /posts/{id}", [lambda post_id=post_id: client.delete(f"/posts/{post_id}", headers=headers) for post_id in post_ids])
+
+    access_tokens = [token["access_token"] for token in tokens]
+    await run("POST /introspect", [
+        lambda batch=access_tokens[start:start + INTROSPECT_BATCH]: client.post("/introspect", json={"tokens": batch})
+        for start in range(0, len(access_tokens), INTROSPECT_BATCH)
+    ])
+
+    await run("POST /logout", [lambda token=token: client.post("/logout", headers=bearer(token["access_token"])) for token in other_tokens])
+    await run("POST /logout-all", [lambda token=token: client.post("/logout-all", headers=bearer(token["access_token"])) for token in user_tokens.values()])
+
+    return {name: phase.result() for name, phase in phases.items()}
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, current in results["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if not previous or previous.get("p95_ms") is None or current["p95_ms"] is None:
+            continue
+
+        change = current["p95_ms"] / previous["p95_ms"] - 1
+        print(f"{name:<20} p95 {previous['p95_ms']:>9.2f} -> {current['p95_ms']:>9.2f} ms ({change:+.1%})")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+async def main(args):
+    counter = None
+    async with contextlib.AsyncExitStack() as stack:
+        if args.url:
+            client = await stack.enter_async_context(httpx.AsyncClient(base_url=args.url, timeout=60))
+        else:
+            from main import app
+
+            # 같은 클라이언트에서 반복 로그인하므로 기본적으로 요청 제한을 끔
+            rate_limiter.enabled = args.rate_limit
+            if args.redis == "fake":
+                stack.enter_context(fake_redis())
+            stack.enter_context(temp_database())
+            counter = stack.enter_context(CallCounter().install())
+            client = await stack.enter_async_context(asgi_client(app))
+
+        endpoints = await scenario(client, counter, args.users, max(args.logins, args.users * 2), args.posts, args.concurrency)
+
+    results = {
+        "meta": {
+            "revision": git_revision(),
+            "target": args.url or "asgi",
+            "redis": None if args.url else args.redis,
+            "database_mode": None if args.url else database.DATABASE_MODE,
+            "concurrency": args.concurrency,
+        },
+        "endpoints": endpoints,
+    }
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"p95 regression over {args.threshold:.0%}: {', '.join(regressions)}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--redis", choices=("fake", "local"), default="fake")
+    parser.add_argument("--rate-limit", action="store_true", help="in-process 실행 시 로그인/회원가입 요청 제한 유지")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (지정 시 in-process 대신 HTTP로 요청)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(main(args))
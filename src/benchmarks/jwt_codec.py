@@ -0,0 +1,97 @@
+"""
+JWT 코덱 백엔드별 encode/decode 처리량(ops/sec) 비교
+
+측정 전에 백엔드 간 교차 검증(A로 발급 -> B로 검증)과 위조/만료 토큰 거부를 확인하고
+결과가 다르면 측정하지 않고 종료함 (PyJWT는 설치된 경우에만 포함)
+    cd src && python -m benchmarks.jwt_codec --iterations 50000
+"""
+import argparse
+from datetime import datetime, timedelta
+import time
+
+from app.utils.auth import LEGACY_KEY_ID, key_ring
+from app.utils.jwt_codec import JWT_CODECS, JWTCodec
+
+
+def sample_payload(expires_delta: timedelta = timedelta(minutes=30)) -> dict:
+    return {
+        "username": "benchmark-user",
+        "email": "benchmark-user@example.com",
+        "user_id": 123456,
+        "exp": datetime.utcnow() + expires_delta,
+        "iat": time.time(),
+        "jti": "benchmark-token-id",
+    }
+
+
+def resolve_key(kid):
+    return key_ring.verification_key(kid or LEGACY_KEY_ID)
+
+
+def available_codecs() -> dict[str, JWTCodec]:
+    codecs = {}
+    for name, codec_class in JWT_CODECS.items():
+        try:
+            codecs[name] = codec_class()
+        except ImportError:
+            print(f"skip {name}: not installed")
+    return codecs
+
+
+def tamper(token: str) -> str:
+    head, _, signature = token.rpartition(".")
+    return f"{head}.{'A' if signature[0] != 'A' else 'B'}{signature[1:]}"
+
+
+def cross_check(codecs: dict[str, JWTCodec]) -> list[str]:
+    errors = []
+    key = key_ring.signing_key()
+
+    for issuer_name, issuer in codecs.items():
+        token = issuer.encode(sample_payload(), key)
+        expired = issuer.encode(sample_payload(timedelta(minutes=-1)), key)
+
+        for verifier_name, verifier in codecs.items():
+            pair = f"{issuer_name} -> {verifier_name}"
+            payload = verifier.decode(token, resolve_key)
+            if payload is None or payload.get("user_id") != 123456:
+                errors.append(f"{pair}: valid token rejected")
+            if verifier.decode(tamper(token), resolve_key) is not None:
+                errors.append(f"{pair}: tampered token accepted")
+            if verifier.decode(expired, resolve_key) is not None:
+                errors.append(f"{pair}: expired token accepted")
+
+    return errors
+
+
+def ops_per_sec(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def main(iterations: int):
+    codecs = available_codecs()
+    errors = cross_check(codecs)
+    if errors:
+        for error in errors:
+            print(error)
+        raise SystemExit(1)
+
+    key = key_ring.signing_key()
+    payload = sample_payload()
+
+    print(f"{'codec':<8} {'encode/s':>12} {'decode/s':>12}")
+    for name, codec in codecs.items():
+        token = codec.encode(payload, key)
+        encode_rate = ops_per_sec(lambda: codec.encode(payload, key), iterations)
+        decode_rate = ops_per_sec(lambda: codec.decode(token, resolve_key), iterations)
+        print(f"{name:<8} {encode_rate:>12,.0f} {decode_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,71 @@
+"""
+로그인 폭주 중 토큰 인증 엔드포인트 지연시간 비교
+bcrypt가 프로세스 풀에서 실행되므로 POST /posts 지연시간은 로그인 부하와 무관해야 함
+
+로컬 Redis(localhost:6379)가 필요함
+    cd src && python -m benchmarks.login_storm --requests 500 --login-concurrency 64
+"""
+import argparse
+import asyncio
+
+from app.models.user import User
+from app.utils.auth import create_access_token
+from app.utils.security import get_password_hash
+from benchmarks.common import asgi_client, percentile, temp_database, timed
+from main import app
+
+PASSWORD = "benchmark-password"
+
+
+async def protected_latencies(client, headers: dict, total: int) -> list[float]:
+    latencies = []
+    for i in range(total):
+        elapsed, response = await timed(client.post("/posts", json={"title": f"t{i}", "content": "c"}, headers=headers))
+        response.raise_for_status()
+        latencies.append(elapsed)
+    return latencies
+
+
+async def login_storm(client, stop: asyncio.Event, concurrency: int) -> dict:
+    counts = {}
+
+    async def worker():
+        while not stop.is_set():
+            response = await client.post("/login", json={"email": "bench@example.com", "password": PASSWORD})
+            counts[response.status_code] = counts.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return counts
+
+
+async def main(total: int, login_concurrency: int):
+    with temp_database() as SessionLocal:
+        with SessionLocal() as db:
+            user = User(email="bench@example.com", username="bench", password=get_password_hash(PASSWORD))
+            db.add(user)
+            db.commit()
+            token = create_access_token({"username": user.username, "email": user.email, "user_id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async with asgi_client(app) as client:
+            await protected_latencies(client, headers, min(total, 100))
+            idle = await protected_latencies(client, headers, total)
+
+            stop = asyncio.Event()
+            storm = asyncio.create_task(login_storm(client, stop, login_concurrency))
+            loaded = await protected_latencies(client, headers, total)
+            stop.set()
+            login_counts = await storm
+
+        print(f"{'condition':<14} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for label, latencies in (("idle", idle), ("login storm", loaded)):
+            print(f"{label:<14} {percentile(latencies, 50) * 1000:>8.2f} {percentile(latencies, 95) * 1000:>8.2f} {percentile(latencies, 99) * 1000:>8.2f}")
+        print(f"login responses: {login_counts}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--login-concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.login_concurrency))
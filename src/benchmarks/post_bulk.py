@@ -0,0 +1,92 @@
+"""
+단건 API vs 일괄 API 처리량 비교 (생성/수정/삭제)
+
+로컬 Redis(localhost:6379)가 필요함
+    cd src && python -m benchmarks.post_bulk --posts 5000 --batch-size 500
+"""
+import argparse
+import asyncio
+import time
+
+from app.models.user import User
+from app.utils.auth import create_access_token
+from benchmarks.common import asgi_client, temp_database
+from main import app
+
+
+async def single(client, headers: dict, total: int) -> dict:
+    elapsed = {}
+
+    start = time.perf_counter()
+    ids = []
+    for i in range(total):
+        response = await client.post("/posts", json={"title": f"t{i}", "content": "c"}, headers=headers)
+        ids.append(response.json()["id"])
+    elapsed["create"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for post_id in ids:
+        await client.put(f"/posts/{post_id}", json={"title": "updated"}, headers=headers)
+    elapsed["update"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for post_id in ids:
+        await client.delete(f"/posts/{post_id}", headers=headers)
+    elapsed["delete"] = time.perf_counter() - start
+
+    return elapsed
+
+
+async def bulk(client, headers: dict, total: int, batch_size: int) -> dict:
+    elapsed = {}
+    batches = [range(start, min(start + batch_size, total)) for start in range(0, total, batch_size)]
+
+    start = time.perf_counter()
+    ids = []
+    for batch in batches:
+        response = await client.post("/posts/bulk", json={"items": [{"title": f"t{i}", "content": "c"} for i in batch]}, headers=headers)
+        ids.extend(result["id"] for result in response.json()["results"])
+    elapsed["create"] = time.perf_counter() - start
+
+    id_batches = [ids[start:start + batch_size] for start in range(0, len(ids), batch_size)]
+
+    start = time.perf_counter()
+    for batch in id_batches:
+        await client.put("/posts/bulk", json={"items": [{"id": post_id, "title": "updated"} for post_id in batch]}, headers=headers)
+    elapsed["update"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for batch in id_batches:
+        await client.request("DELETE", "/posts/bulk", json={"ids": batch}, headers=headers)
+    elapsed["delete"] = time.perf_counter() - start
+
+    return elapsed
+
+
+async def main(total: int, batch_size: int):
+    with temp_database() as SessionLocal:
+        with SessionLocal() as db:
+            user = User(email="bench@example.com", username="bench", password="x")
+            db.add(user)
+            db.commit()
+            token = create_access_token({"username": user.username, "email": user.email, "user_id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async with asgi_client(app) as client:
+            results = {
+                "single": await single(client, headers, total),
+                "bulk": await bulk(client, headers, total, batch_size),
+            }
+
+    print(f"{'mode':<8} {'op':<8} {'posts/s':>10}")
+    for mode, elapsed in results.items():
+        for op, seconds in elapsed.items():
+            print(f"{mode:<8} {op:<8} {total / seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.posts, args.batch_size))
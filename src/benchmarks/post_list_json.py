@@ -0,0 +1,101 @@
+"""
+게시글 목록 응답 직렬화 비교 (페이지당 100/1,000/10,000행)
+- fastapi: ORM 객체 -> PostPage 검증 -> jsonable_encoder -> 표준 json (기존 response_model 경로)
+- pydantic: ORM 객체 -> PostPage.model_dump_json (POST_LIST_FAST_JSON=false)
+- rows: 필요한 컬럼만 행 튜플로 조회 -> fast_json.dumps (POST_LIST_FAST_JSON=true)
+조회 시간을 포함하며, rows와 pydantic 본문이 바이트 단위로 같은지도 함께 확인
+
+    cd src && python -m benchmarks.post_list_json --sizes 100 1000 10000
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import tempfile
+import time
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.post import Post
+from app.models.user import User
+from app.schemas.post import PostPage
+from app.services.post_service import POST_PAGE_FIELDS, PostService
+from app.utils import fast_json
+
+REPEAT = 10
+
+
+def seed(engine, total: int):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"email": f"u{i}@example.com", "username": f"u{i}", "password": "x"} for i in range(100)])
+        conn.execute(insert(Post), [
+            {
+                "title": f"게시글 제목 {i}",
+                "content": "본문 내용 " * 40,
+                "author_id": i % 100 + 1,
+                "create_at": start + timedelta(seconds=i),
+                "updated_at": start + timedelta(seconds=i, microseconds=i % 1000),
+            }
+            for i in range(total)
+        ])
+
+
+async def fastapi_path(service: PostService, limit: int) -> bytes:
+    posts, next_cursor = await service.get_posts(limit)
+    page = PostPage(items=posts, next_cursor=next_cursor)
+    return json.dumps(jsonable_encoder(page), ensure_ascii=False, separators=(",", ":")).encode()
+
+async def pydantic_path(service: PostService, limit: int) -> bytes:
+    posts, next_cursor = await service.get_posts(limit)
+    return PostPage(items=posts, next_cursor=next_cursor).model_dump_json().encode()
+
+async def rows_path(service: PostService, limit: int) -> bytes:
+    rows, next_cursor = await service.get_post_rows(limit)
+    return fast_json.dumps({"items": [dict(zip(POST_PAGE_FIELDS, row)) for row in rows], "next_cursor": next_cursor})
+
+
+async def timed_ms(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        await func()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+async def main(sizes: list[int]):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, max(sizes) + 1)
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        print(f"encoder: {'orjson' if fast_json.orjson is not None else 'json (orjson 미설치)'}")
+        print(f"{'rows':>6} {'fastapi ms':>11} {'pydantic ms':>12} {'rows ms':>8} {'speedup':>8} {'same body':>10}")
+        for size in sizes:
+            # 세션마다 identity map이 쌓이지 않도록 측정마다 새 세션 사용
+            async def run(path_func):
+                async with AsyncSessionLocal() as db:
+                    return await path_func(PostService(db), size)
+
+            same = await run(pydantic_path) == await run(rows_path)
+            baseline = await timed_ms(lambda: run(fastapi_path))
+            pydantic = await timed_ms(lambda: run(pydantic_path))
+            rows = await timed_ms(lambda: run(rows_path))
+            print(f"{size:>6} {baseline:>11.2f} {pydantic:>12.2f} {rows:>8.2f} {baseline / rows:>7.1f}x {str(same):>10}")
+
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes))
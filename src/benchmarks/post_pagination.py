@@ -0,0 +1,86 @@
+"""
+키셋 페이지네이션 vs OFFSET 페이지 조회 시간 비교 (기본 1M 게시글)
+
+    cd src && python -m benchmarks.post_pagination --posts 1000000 --limit 20
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.post import Post
+from app.models.user import User
+from app.services.post_service import PostService
+from app.utils.pagination import encode_cursor
+
+BATCH_SIZE = 50_000
+DEPTHS = (0, 1_000, 10_000, 100_000, 500_000, 990_000)
+REPEAT = 20
+
+
+def seed(engine, total: int):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"email": f"u{i}@example.com", "username": f"u{i}", "password": "x"} for i in range(100)])
+        for offset in range(0, total, BATCH_SIZE):
+            conn.execute(insert(Post), [
+                {
+                    "title": f"title {i}",
+                    "content": "content",
+                    "author_id": i % 100 + 1,
+                    # 같은 create_at을 가진 행도 섞이도록 10개씩 같은 시각 사용
+                    "create_at": start + timedelta(seconds=i // 10),
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, total))
+            ])
+
+
+async def timed_ms(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        await func()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+async def main(total: int, limit: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, total)
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        print(f"{'depth':>8} {'keyset ms':>10} {'offset ms':>10}")
+        async with AsyncSessionLocal() as db:
+            service = PostService(db)
+            for depth in (d for d in DEPTHS if d < total):
+                cursor = None
+                if depth:
+                    row = (await db.execute(
+                        select(Post.create_at, Post.id).order_by(Post.create_at.desc(), Post.id.desc()).offset(depth - 1).limit(1)
+                    )).one()
+                    cursor = encode_cursor([row.create_at.isoformat(), row.id])
+
+                keyset = await timed_ms(lambda: service.get_posts(limit, cursor))
+                offset_query = select(Post).order_by(Post.create_at.desc(), Post.id.desc()).offset(depth).limit(limit)
+                offset = await timed_ms(lambda: db.execute(offset_query))
+                print(f"{depth:>8} {keyset:>10.2f} {offset:>10.2f}")
+
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.posts, args.limit))
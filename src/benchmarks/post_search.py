@@ -0,0 +1,117 @@
+"""
+FTS5 검색(search_posts) vs LIKE 전체 스캔 조회 시간 비교 (기본 1M 게시글)
+기존 데이터 색인 재구성(rebuild) 시간과 검색 결과 건수 일치 여부도 함께 출력
+
+    cd src && python -m benchmarks.post_search --posts 1000000 --limit 20
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine, func, insert, or_, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.post import Post
+from app.models.user import User
+from app.services.post_search import POST_SEARCH_TABLE, init_post_search, to_fts_query
+from app.services.post_service import PostService
+
+BATCH_SIZE = 50_000
+# 단어는 모두 같은 길이라 LIKE 부분 일치와 FTS 단어 일치의 결과 건수가 같음
+VOCABULARY = [f"w{i:04d}" for i in range(5_000)]
+WORDS_PER_POST = 30
+REPEAT = 10
+PAGES = 5
+
+
+# 앞쪽 단어일수록 자주 등장하도록 치우친 분포 (흔한 단어 ~ 드문 단어)
+def random_text(rng: random.Random, words: int) -> str:
+    return " ".join(VOCABULARY[min(int(rng.expovariate(1 / 300)), len(VOCABULARY) - 1)] for _ in range(words))
+
+
+def seed(engine, total: int):
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"email": f"u{i}@example.com", "username": f"u{i}", "password": "x"} for i in range(100)])
+        for offset in range(0, total, BATCH_SIZE):
+            conn.execute(insert(Post), [
+                {
+                    "title": random_text(rng, 5),
+                    "content": random_text(rng, WORDS_PER_POST),
+                    "author_id": i % 100 + 1,
+                    "create_at": start + timedelta(seconds=i),
+                }
+                for i in range(offset, min(offset + BATCH_SIZE, total))
+            ])
+
+
+def like_query(query: str, limit: int):
+    conditions = [or_(Post.title.like(f"%{term}%"), Post.content.like(f"%{term}%")) for term in query.split()]
+    return select(Post).where(*conditions).order_by(Post.id).limit(limit)
+
+
+async def timed_ms(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        await func()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+async def main(total: int, limit: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, total)
+
+        # 트리거 도입 전 데이터를 색인하는 경우와 같음
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            init_post_search(conn)
+        print(f"rebuild {total} posts: {time.perf_counter() - start:.1f}s")
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        queries = (VOCABULARY[0], VOCABULARY[300], VOCABULARY[2_000], f"{VOCABULARY[10]} {VOCABULARY[400]}")
+        print(f"{'query':>12} {'matches':>8} {'like':>8} {'fts ms':>8} {'fts p' + str(PAGES) + ' ms':>10} {'like ms':>9}")
+        async with AsyncSessionLocal() as db:
+            service = PostService(db)
+            for query in queries:
+                fts_count = (await db.execute(
+                    text(f"SELECT count(*) FROM {POST_SEARCH_TABLE} WHERE {POST_SEARCH_TABLE} MATCH :q"),
+                    {"q": to_fts_query(query)},
+                )).scalar_one()
+                like_count = (await db.execute(
+                    select(func.count()).select_from(like_query(query, total).subquery())
+                )).scalar_one()
+
+                first_page = await timed_ms(lambda: service.search_posts(query, limit))
+
+                cursor = None
+                for _ in range(PAGES - 1):
+                    _, cursor = await service.search_posts(query, limit, cursor)
+                    if cursor is None:
+                        break
+                deep_page = await timed_ms(lambda: service.search_posts(query, limit, cursor)) if cursor else float("nan")
+
+                statement = like_query(query, limit)
+                like = await timed_ms(lambda: db.execute(statement))
+                print(f"{query:>12} {fts_count:>8} {like_count:>8} {first_page:>8.2f} {deep_page:>10.2f} {like:>9.2f}")
+
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.posts, args.limit))
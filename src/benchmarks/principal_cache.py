@@ -0,0 +1,62 @@
+"""
+principal 캐시 적용 전/후 게시글 엔드포인트 지연시간(p50/p99) 비교
+
+로컬 Redis(localhost:6379)가 필요함
+    cd src && python -m benchmarks.principal_cache --requests 2000
+"""
+import argparse
+import asyncio
+
+from app.models.user import User
+from app.services.principal_cache import principal_cache
+from app.utils.auth import create_access_token
+from benchmarks.common import asgi_client, percentile, temp_database, timed
+from main import app
+
+
+async def measure(client, headers: dict, total: int) -> dict:
+    create_latencies, update_latencies = [], []
+
+    for i in range(total):
+        elapsed, response = await timed(client.post("/posts", json={"title": f"t{i}", "content": "c"}, headers=headers))
+        response.raise_for_status()
+        create_latencies.append(elapsed)
+
+        post_id = response.json()["id"]
+        elapsed, response = await timed(client.put(f"/posts/{post_id}", json={"title": f"u{i}"}, headers=headers))
+        response.raise_for_status()
+        update_latencies.append(elapsed)
+
+    return {
+        "POST /posts": create_latencies,
+        "PUT /posts/{id}": update_latencies,
+    }
+
+
+async def main(total: int):
+    with temp_database() as SessionLocal:
+        with SessionLocal() as db:
+            user = User(email="bench@example.com", username="bench", password="x")
+            db.add(user)
+            db.commit()
+            token = create_access_token({"username": user.username, "email": user.email, "user_id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async with asgi_client(app) as client:
+            results = {}
+            for label, ttl in (("no cache", 0), ("cached", 30)):
+                principal_cache.ttl = ttl
+                await measure(client, headers, min(total, 200))
+                results[label] = await measure(client, headers, total)
+
+        print(f"{'endpoint':<18} {'mode':<10} {'p50 ms':>8} {'p99 ms':>8}")
+        for label, routes in results.items():
+            for route, latencies in routes.items():
+                print(f"{route:<18} {label:<10} {percentile(latencies, 50) * 1000:>8.2f} {percentile(latencies, 99) * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
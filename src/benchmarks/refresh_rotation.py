@@ -0,0 +1,150 @@
+"""
+refresh token 회전 동시성 확인 및 지연시간 비교
+    validate: 기존 방식 (회전 없이 SISMEMBER/ZSCORE 확인만)
+    naive:    확인 + 이전 id 삭제 + 새 id 저장을 각각 호출 (3회 왕복, 경쟁 조건 있음)
+    lua:      rotate_refresh_token 스크립트 (1회 왕복, 원자적)
+
+같은 refresh token으로 동시에 회전을 요청하면 하나만 성공하고 나머지는 재사용으로 감지되어
+family 전체가 폐기되는지 확인하고, 결과가 다르면 exit 1
+로컬 Redis(localhost:6379) 또는 fakeredis(--redis fake, lupa 필요) 사용
+    cd src && python -m benchmarks.refresh_rotation --requests 2000 --concurrency 50
+"""
+import argparse
+import asyncio
+import contextlib
+import time
+
+from fastapi import FastAPI
+
+from app.core.redis_config import get_async_redis, init_redis
+from app.services.token_service import (
+    REFRESH_REUSED,
+    REFRESH_ROTATED,
+    REFRESH_TOKEN_PREFIX,
+    REFRESH_TOKEN_ROTATED_PREFIX,
+    AsyncTokenService,
+    refresh_token_member,
+)
+from app.utils.auth import generate_token_id
+from benchmarks.common import fake_redis, percentile
+
+USER_ID = 987654321
+
+
+async def check_concurrent_rotation(concurrency: int) -> list[str]:
+    errors = []
+    await AsyncTokenService.remove_refresh_token(USER_ID)
+
+    root = generate_token_id()
+    other = generate_token_id()
+    await AsyncTokenService.store_refresh_token(USER_ID, root)
+    await AsyncTokenService.store_refresh_token(USER_ID, other)
+
+    results = await asyncio.gather(*(
+        AsyncTokenService.rotate_refresh_token(USER_ID, root, None, generate_token_id())
+        for _ in range(concurrency)
+    ))
+    if results.count(REFRESH_ROTATED) != 1:
+        errors.append(f"concurrent rotation: {results.count(REFRESH_ROTATED)} succeeded (expected 1)")
+    if results.count(REFRESH_REUSED) != concurrency - 1:
+        errors.append(f"concurrent rotation: {results.count(REFRESH_REUSED)} reuse detected (expected {concurrency - 1})")
+
+    members = await get_async_redis().zrange(f"{REFRESH_TOKEN_PREFIX}{USER_ID}", 0, -1)
+    if any(member == root or member.startswith(f"{root}:") for member in members):
+        errors.append("concurrent rotation: family not revoked after reuse")
+    if other not in members:
+        errors.append("concurrent rotation: unrelated session was revoked")
+
+    # 순차 회전 후 중간 토큰 재사용
+    first = generate_token_id()
+    second = generate_token_id()
+    await AsyncTokenService.rotate_refresh_token(USER_ID, other, None, first)
+    await AsyncTokenService.rotate_refresh_token(USER_ID, first, other, second)
+    if await AsyncTokenService.rotate_refresh_token(USER_ID, first, other, generate_token_id()) != REFRESH_REUSED:
+        errors.append("sequential rotation: reuse not detected")
+    if await AsyncTokenService.validate_refresh_token(USER_ID, refresh_token_member(second, other)):
+        errors.append("sequential rotation: latest token still valid after reuse")
+
+    await AsyncTokenService.remove_refresh_token(USER_ID)
+    return errors
+
+
+async def naive_rotate(user_id: int, token_id: str, new_token_id: str) -> bool:
+    if not await AsyncTokenService.validate_refresh_token(user_id, token_id):
+        return False
+    await AsyncTokenService.remove_refresh_token(user_id, token_id)
+    await AsyncTokenService.store_refresh_token(user_id, new_token_id)
+    return True
+
+
+async def clear_users(user_ids: range):
+    async with get_async_redis().pipeline(transaction=False) as pipe:
+        for user_id in user_ids:
+            pipe.delete(f"{REFRESH_TOKEN_PREFIX}{user_id}", f"{REFRESH_TOKEN_ROTATED_PREFIX}{user_id}")
+        await pipe.execute()
+
+
+# 세션 수 제한에 걸리지 않도록 요청마다 다른 사용자의 토큰 하나를 회전
+async def measure(total: int, concurrency: int) -> dict:
+    results = {}
+    user_ids = range(USER_ID + 1, USER_ID + 1 + total)
+    modes = {
+        "validate": lambda user_id, token_id: AsyncTokenService.validate_refresh_token(user_id, token_id),
+        "naive": lambda user_id, token_id: naive_rotate(user_id, token_id, generate_token_id()),
+        "lua": lambda user_id, token_id: AsyncTokenService.rotate_refresh_token(user_id, token_id, None, generate_token_id()),
+    }
+
+    for mode, call in modes.items():
+        await clear_users(user_ids)
+        sessions = [(user_id, generate_token_id()) for user_id in user_ids]
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            for user_id, token_id in sessions:
+                pipe.zadd(f"{REFRESH_TOKEN_PREFIX}{user_id}", {token_id: time.time() + 3600})
+            await pipe.execute()
+
+        latencies = []
+        remaining = iter(sessions)
+
+        async def worker():
+            for user_id, token_id in remaining:
+                start = time.perf_counter()
+                await call(user_id, token_id)
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        results[mode] = latencies
+
+    await clear_users(user_ids)
+    return results
+
+
+async def main(total: int, concurrency: int, use_fake: bool):
+    app = FastAPI()
+    init_redis(app)
+
+    with fake_redis() if use_fake else contextlib.nullcontext():
+        await app.router.startup()
+        try:
+            errors = await check_concurrent_rotation(concurrency)
+            if errors:
+                for error in errors:
+                    print(error)
+                raise SystemExit(1)
+            print(f"concurrency check passed ({concurrency} concurrent refreshes)")
+
+            results = await measure(total, concurrency)
+        finally:
+            await app.router.shutdown()
+
+    print(f"{'mode':<10} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode, latencies in results.items():
+        print(f"{mode:<10} {percentile(latencies, 50) * 1000:>8.3f} {percentile(latencies, 99) * 1000:>8.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--redis", choices=("fake", "local"), default="local")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.redis == "fake"))
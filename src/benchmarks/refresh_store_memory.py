@@ -0,0 +1,88 @@
+"""
+refresh token 저장소 레이아웃별 Redis 메모리 사용량 비교
+    old: refresh:<user_id> set + 로그인마다 EXPIRE 연장 (세션 수 제한 없음)
+    new: refresh-tokens:<user_id> sorted set (score: 만료 시각) + 세션 수 제한
+
+일반 사용자 --users명(각 --sessions개 세션)과 스크립트로 --script-logins번 로그인한 사용자 한 명을 측정
+지정한 Redis DB를 FLUSHDB 하므로 전용 DB 번호를 사용할 것
+    cd src && python -m benchmarks.refresh_store_memory --users 1000000 --sessions 3 --db 15
+"""
+import argparse
+import time
+
+import redis
+
+from app.core.redis_config import REDIS_HOST, REDIS_PASSWORD, REDIS_PORT
+from app.services.token_service import (
+    LEGACY_REFRESH_TOKEN_PREFIX,
+    REFRESH_TOKEN_LIFETIME,
+    REFRESH_TOKEN_MAX_SESSIONS,
+    REFRESH_TOKEN_PREFIX,
+    STORE_REFRESH_TOKEN_SCRIPT,
+)
+from app.utils.auth import generate_token_id
+
+BATCH_SIZE = 10000
+
+
+def store_old(pipe, user_id: int, token_id: str, now: float):
+    key = f"{LEGACY_REFRESH_TOKEN_PREFIX}{user_id}"
+    pipe.sadd(key, token_id)
+    pipe.expire(key, REFRESH_TOKEN_LIFETIME + 24 * 60 * 60)
+
+
+def store_new(script):
+    def store(pipe, user_id: int, token_id: str, now: float):
+        script(
+            keys=[f"{REFRESH_TOKEN_PREFIX}{user_id}"],
+            args=[token_id, now + REFRESH_TOKEN_LIFETIME, now, REFRESH_TOKEN_MAX_SESSIONS],
+            client=pipe,
+        )
+    return store
+
+
+def fill(client: redis.Redis, logins: list[tuple[int, int]], store) -> int:
+    client.flushdb()
+    before = client.info("memory")["used_memory"]
+
+    # (user_id, 로그인 횟수) 목록을 BATCH_SIZE 단위 파이프라인으로 기록
+    pipe = client.pipeline(transaction=False)
+    queued = 0
+    for user_id, count in logins:
+        for _ in range(count):
+            store(pipe, user_id, generate_token_id(), time.time())
+            queued += 1
+            if queued >= BATCH_SIZE:
+                pipe.execute()
+                queued = 0
+    pipe.execute()
+
+    used = client.info("memory")["used_memory"] - before
+    client.flushdb()
+    return used
+
+
+def main(users: int, sessions: int, script_logins: int, db: int):
+    client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=db, password=REDIS_PASSWORD)
+    script = client.register_script(STORE_REFRESH_TOKEN_SCRIPT)
+    layouts = {"old (set)": store_old, "new (zset+cap)": store_new(script)}
+    workloads = {
+        f"{users:,} users x {sessions}": [(user_id, sessions) for user_id in range(users)],
+        f"1 user x {script_logins:,}": [(0, script_logins)],
+    }
+
+    print(f"{'workload':<24} {'layout':<16} {'total MiB':>10} {'bytes/user':>12}")
+    for workload, logins in workloads.items():
+        for name, store in layouts.items():
+            used = fill(client, logins, store)
+            print(f"{workload:<24} {name:<16} {used / 1024 / 1024:>10.1f} {used / len(logins):>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--sessions", type=int, default=3)
+    parser.add_argument("--script-logins", type=int, default=10_000)
+    parser.add_argument("--db", type=int, default=15)
+    args = parser.parse_args()
+    main(args.users, args.sessions, args.script_logins, args.db)
@@ -0,0 +1,66 @@
+"""
+블랙리스트 키 레이아웃별 Redis 메모리 사용량 비교
+    old: blacklist:<전체 JWT>
+    new: blacklist:<jti>
+
+지정한 Redis DB를 FLUSHDB 하므로 전용 DB 번호를 사용할 것
+    cd src && python -m benchmarks.revocation_memory --count 1000000 --db 15
+"""
+import argparse
+import secrets
+
+import redis
+
+from app.core.redis_config import REDIS_HOST, REDIS_PASSWORD, REDIS_PORT
+from app.services.token_service import DEFAULT_TOKEN_EXPIRY, TOKEN_BLACKLIST_PREFIX
+from app.utils.auth import create_access_token, generate_token_id, get_token_id, verify_token
+
+BATCH_SIZE = 10000
+
+
+def sample_token() -> str:
+    return create_access_token({"username": "benchmark-user", "email": "benchmark-user@example.com", "user_id": 123456})
+
+
+def fill(client: redis.Redis, count: int, make_suffix) -> int:
+    client.flushdb()
+    before = client.info("memory")["used_memory"]
+
+    for start in range(0, count, BATCH_SIZE):
+        with client.pipeline(transaction=False) as pipe:
+            for _ in range(min(BATCH_SIZE, count - start)):
+                pipe.set(f"{TOKEN_BLACKLIST_PREFIX}{make_suffix()}", "1", ex=DEFAULT_TOKEN_EXPIRY)
+            pipe.execute()
+
+    used = client.info("memory")["used_memory"] - before
+    client.flushdb()
+    return used
+
+
+def main(count: int, db: int):
+    client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=db, password=REDIS_PASSWORD)
+
+    # 전체 JWT를 매번 발급하면 느리므로 서명부만 바꿔 같은 길이의 고유 키를 만듦
+    template = sample_token()
+    header_payload, signature = template.rsplit(".", 1)
+
+    def old_suffix() -> str:
+        return f"{header_payload}.{secrets.token_urlsafe(32)[:len(signature)]}"
+
+    layouts = {
+        "old (full JWT)": (old_suffix, len(template)),
+        "new (jti)": (generate_token_id, len(get_token_id(template, verify_token(template)))),
+    }
+
+    print(f"{'layout':<16} {'key bytes':>10} {'total MiB':>10} {'bytes/key':>10}")
+    for name, (make_suffix, suffix_length) in layouts.items():
+        used = fill(client, count, make_suffix)
+        print(f"{name:<16} {len(TOKEN_BLACKLIST_PREFIX) + suffix_length:>10} {used / 1024 / 1024:>10.1f} {used / count:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--db", type=int, default=15)
+    args = parser.parse_args()
+    main(args.count, args.db)
@@ -1,7 +1,14 @@
 from fastapi import FastAPI
+from sqlalchemy import inspect, text
 from app.apis import auth, user, post
-from app.core.redis_config import init_redis
-from app.database import Base, engine
+from app.core.metrics import init_metrics
+from app.core.redis_config import init_redis, redis_health
+from app.services.post_cache import post_cache
+from app.services.post_search import init_post_search
+from app.services.token_service import init_refresh_token_sweeper, revocation_filter
+from app.database import DATABASE_MODE, Base, async_engine, async_read_engine, engine
+from app.utils.auth import token_cache
+from app.utils.security import init_password_hasher
 
 app = FastAPI(
     title="JWT Redis Auth",
@@ -17,16 +24,37 @@ app.include_router(auth.router, tags=["auth"])
 app.include_router(post.router, tags=["post"])
 
 
+# shutdown 시 구독/백그라운드 작업을 먼저 정리하도록 init_redis보다 먼저 등록
+revocation_filter.init_app(app)
+init_refresh_token_sweeper(app)
 init_redis(app)
+init_password_hasher(app)
+init_metrics(app)
 
+# Redis breaker가 열려 있으면 degraded로 표시
 @app.get("/")
 def health_check():
-    return {"status": "ok"}
+    redis_status = redis_health()
+    return {
+        "status": "ok" if redis_status["state"] == "closed" else "degraded",
+        "redis": redis_status,
+    }
+
+@app.get("/stats/cache")
+def cache_stats():
+    return {
+        "posts": post_cache.stats(),
+        "tokens": token_cache.stats(),
+    }
 
 @app.get("/ping")
 async def ping_db():
     try:
-        with engine.connect() as conn:
+        if DATABASE_MODE == "sync":
+            with engine.connect() as conn:
+                return {"status": "connected"}
+
+        async with async_engine.connect() as conn:
             return {"status": "connected"}
     except Exception as e:
         return {"status":"error", "message": str(e)}
@@ -34,4 +62,28 @@ async def ping_db():
 @app.on_event("startup")
 def init_db():
     Base.metadata.create_all(bind=engine)
+    # create_all은 기존 테이블에 컬럼을 추가하지 않으므로 직접 추가
+    with engine.begin() as conn:
+        post_columns = {column["name"] for column in inspect(conn).get_columns("posts")}
+        if "updated_at" not in post_columns:
+            conn.execute(text("ALTER TABLE posts ADD COLUMN updated_at DATETIME"))
+            conn.execute(text("UPDATE posts SET updated_at = create_at"))
+        # SQLite의 server_default(CURRENT_TIMESTAMP)로 저장된 행은 소수 초가 없어
+        # 키셋 커서(YYYY-MM-DD HH:MM:SS.ffffff)와의 문자열 비교가 어긋나므로 같은 형식으로 맞춤
+        if conn.dialect.name == "sqlite":
+            for column in ("create_at", "updated_at"):
+                conn.execute(text(f"UPDATE posts SET {column} = {column} || '.000000' WHERE length({column}) = 19"))
+    # 기존 테이블에 새로 추가된 인덱스 생성
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    # SQLite면 게시글 검색 색인(FTS5)과 동기화 트리거 생성
+    with engine.begin() as conn:
+        init_post_search(conn)
+
+@app.on_event("shutdown")
+async def close_db():
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
 
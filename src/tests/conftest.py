@@ -0,0 +1,27 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.common import fake_redis, temp_database
+from main import app
+
+
+# 임시 SQLite 파일과 fakeredis로 앱 전체를 실행
+@pytest.fixture
+def client():
+    with fake_redis(), temp_database():
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture
+def tokens(client) -> dict:
+    account = {"email": "tester@example.com", "username": "tester", "password": "test-password"}
+    assert client.post("/register", json=account).status_code == 200
+
+    response = client.post("/login", json={"email": account["email"], "password": account["password"]})
+    assert response.status_code == 200
+    return response.json()
+
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,13 @@
+from tests.conftest import bearer
+
+
+def test_access_token_is_accepted(client, tokens):
+    response = client.post("/posts", json={"title": "title", "content": "content"}, headers=bearer(tokens["access_token"]))
+
+    assert response.status_code == 200
+
+
+def test_refresh_token_is_rejected_as_bearer(client, tokens):
+    response = client.post("/posts", json={"title": "title", "content": "content"}, headers=bearer(tokens["refresh_token"]))
+
+    assert response.status_code == 401
@@ -0,0 +1,31 @@
+import pytest
+
+import main
+from app import database
+from app.services import post_search
+from tests.conftest import bearer
+
+
+# DATABASE_MODE=sync: 동기 Session을 스레드풀에서 실행하는 경로
+@pytest.fixture
+def sync_mode(monkeypatch):
+    for module in (database, post_search, main):
+        monkeypatch.setattr(module, "DATABASE_MODE", "sync")
+
+
+def test_sync_mode_serves_posts(sync_mode, client, tokens):
+    headers = bearer(tokens["access_token"])
+
+    created = client.post("/posts", json={"title": "sync title", "content": "sync content"}, headers=headers)
+    assert created.status_code == 200
+    post_id = created.json()["id"]
+
+    assert client.get("/posts/").json()["items"][0]["id"] == post_id
+    assert client.get(f"/posts/{post_id}").json()["title"] == "sync title"
+    assert client.put(f"/posts/{post_id}", json={"title": "updated"}, headers=headers).status_code == 200
+    assert client.get("/posts/search", params={"q": "updated"}).json()["items"][0]["id"] == post_id
+    assert "updated" in client.get("/posts/export").text
+    assert client.delete(f"/posts/{post_id}", headers=headers).status_code == 200
+
+    response = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 200
@@ -0,0 +1,19 @@
+from main import app
+from tests.conftest import bearer
+
+
+def test_post_list_documents_response_model():
+    schema = app.openapi()["paths"]["/posts/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+
+    assert schema == {"$ref": "#/components/schemas/PostPage"}
+
+
+def test_post_list_returns_json_with_etag(client, tokens):
+    created = client.post("/posts", json={"title": "title", "content": "content"}, headers=bearer(tokens["access_token"]))
+
+    first = client.get("/posts/")
+    second = client.get("/posts/", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.headers["content-type"] == "application/json"
+    assert first.json()["items"][0]["id"] == created.json()["id"]
+    assert second.status_code == 304